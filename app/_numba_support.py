@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import threading
+from functools import wraps
+from typing import Callable
+
+# Numba is optional at runtime: when it cannot be imported the kernels stay
+# plain Python functions and callers keep using their NumPy paths instead.
+try:
+    from numba import config as numba_config
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+    prange = range
+else:
+    # Parallel kernels can be launched from worker threads; a TBB pool first
+    # used off the main thread hangs interpreter shutdown, so rank it last
+    # unless NUMBA_THREADING_LAYER pins a layer explicitly.
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        numba_config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+NUMBA_AVAILABLE = njit is not None
+
+# The workqueue layer deadlocks when parallel kernels are launched from several
+# Python threads at once, so launches are serialized.
+_PARALLEL_LAUNCH_LOCK = threading.Lock()
+
+
+def jit(**options: object) -> Callable[[Callable], Callable]:
+    """njit(**options) when Numba is installed, otherwise the plain function."""
+
+    def decorate(fn: Callable) -> Callable:
+        if not NUMBA_AVAILABLE:
+            return fn
+        compiled = njit(**options)(fn)
+        if not options.get("parallel"):
+            return compiled
+
+        @wraps(fn)
+        def launch(*args: object) -> object:
+            with _PARALLEL_LAUNCH_LOCK:
+                return compiled(*args)
+
+        return launch
+
+    return decorate
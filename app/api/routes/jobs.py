@@ -6,11 +6,12 @@ from urllib.parse import urlparse
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import crud
-from app.db import get_db
+from app import cache, crud
+from app.db import get_async_db, get_db
 from app.models import JobStatus
 from app.security.path_guard import ensure_safe_input_path, ensure_safe_output_path
 from app.schemas import (
@@ -20,6 +21,7 @@ from app.schemas import (
     JobCreateRequest,
     JobEnqueueResponse,
     LastClipUploadEnqueueResponse,
+    JOB_RESPONSE_LIST_ADAPTER,
     JobResponse,
     JobRuntimeResponse,
     LastClipJobCreateRequest,
@@ -47,11 +49,11 @@ _AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg"}
 _IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
 
 
-def _build_job_response(job_id: str, db: Session) -> JobResponse:
-    job = crud.get_job(db, job_id)
+async def _build_job_response(job_id: str, db: AsyncSession) -> JobResponse:
+    job = await crud.get_job_async(db, job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    runtime = crud.get_job_runtime(db, job_id)
+    runtime = await crud.get_job_runtime_async(db, job_id)
     return JobResponse(
         id=job.id,
         job_type=job.job_type,
@@ -1422,32 +1424,36 @@ def enqueue_pipeline_job(
     return JobEnqueueResponse(job_id=job.id, task_id=async_result.id, status=job.status)
 
 
+# Polling endpoints read through the async session so they never hold a threadpool slot.
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(job_id: str, db: Session = Depends(get_db)) -> JobResponse:
-    return _build_job_response(job_id, db)
+async def get_job(job_id: str, db: AsyncSession = Depends(get_async_db)) -> JobResponse:
+    return await _build_job_response(job_id, db)
 
 
 @router.get("/{job_id}/runtime", response_model=JobRuntimeResponse)
-def get_job_runtime(job_id: str, db: Session = Depends(get_db)) -> JobRuntimeResponse:
-    job = crud.get_job(db, job_id)
+async def get_job_runtime(job_id: str, db: AsyncSession = Depends(get_async_db)) -> JobRuntimeResponse | Response:
+    cached = await cache.get_job_runtime(job_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    job = await crud.get_job_async(db, job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    runtime = crud.get_job_runtime(db, job_id)
+    runtime = await crud.get_job_runtime_async(db, job_id)
     if runtime is None:
         raise HTTPException(status_code=404, detail="Job runtime not found")
-    return runtime
+    response = JobRuntimeResponse.model_validate(runtime)
+    await cache.set_job_runtime(job_id, response.model_dump_json())
+    return response
 
 
 @router.get("", response_model=list[JobResponse])
-def list_jobs(
-    db: Session = Depends(get_db),
+async def list_jobs(
+    db: AsyncSession = Depends(get_async_db),
     limit: int = Query(default=20, ge=1, le=100),
-) -> list[JobResponse]:
-    jobs = crud.list_jobs(db, limit=limit)
-    runtimes = crud.list_job_runtimes(db, [j.id for j in jobs])
+) -> Response:
+    rows = await crud.list_jobs_with_runtime_async(db, limit=limit)
     responses: list[JobResponse] = []
-    for job in jobs:
-        rt = runtimes.get(job.id)
+    for job, rt in rows:
         responses.append(
             JobResponse(
                 id=job.id,
@@ -1463,7 +1469,7 @@ def list_jobs(
                 cancel_requested=rt.cancel_requested if rt else None,
             )
         )
-    return responses
+    return Response(content=JOB_RESPONSE_LIST_ADAPTER.dump_json(responses), media_type="application/json")
 
 
 @router.post("/{job_id}/cancel", response_model=JobCancelResponse, status_code=status.HTTP_202_ACCEPTED)
@@ -94,6 +94,45 @@ def upload_asset(
     return asset
 
 
+@router.post(
+    "/{project_id}/assets/batch",
+    response_model=list[AssetResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def upload_assets(
+    project_id: str,
+    files: list[UploadFile] = File(...),
+    start_order_index: int = Form(0),
+    db: Session = Depends(get_db),
+) -> list[AssetResponse]:
+    project = crud.get_project(db, project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    rows: list[dict[str, object]] = []
+    for offset, file in enumerate(files):
+        try:
+            file_path, width, height, safe_name = save_project_asset_file(project_id, file)
+        except Exception as exc:  # noqa: BLE001 - upload/decoding errors
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to save asset {file.filename}: {exc}",
+            ) from exc
+        finally:
+            file.file.close()
+        rows.append(
+            {
+                "order_index": start_order_index + offset,
+                "file_name": safe_name,
+                "file_path": file_path,
+                "width": width,
+                "height": height,
+            }
+        )
+
+    return crud.bulk_add_assets(db, project_id, rows)
+
+
 @router.get("/{project_id}/assets", response_model=list[AssetResponse])
 def list_assets(project_id: str, db: Session = Depends(get_db)) -> list[AssetResponse]:
     project = crud.get_project(db, project_id)
@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from functools import lru_cache
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+_SOCKET_TIMEOUT_S = 0.05
+_BREAKER_FAILURE_THRESHOLD = 3
+_BREAKER_RESET_TIMEOUT_S = 30.0
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency until a cool-down passes, then lets one probe through."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout_s: float) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout_s
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout_s:
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning("job runtime cache unavailable; reading from the database")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_breaker = CircuitBreaker(_BREAKER_FAILURE_THRESHOLD, _BREAKER_RESET_TIMEOUT_S)
+
+
+def _runtime_key(job_id: str) -> str:
+    return f"jobruntime:{job_id}"
+
+
+def _enabled() -> bool:
+    return bool(settings.job_runtime_cache_url) and settings.job_runtime_cache_ttl_ms > 0
+
+
+@lru_cache(maxsize=1)
+def _sync_client():
+    import redis  # noqa: PLC0415 - optional dependency
+
+    return redis.Redis.from_url(
+        settings.job_runtime_cache_url,
+        socket_timeout=_SOCKET_TIMEOUT_S,
+        socket_connect_timeout=_SOCKET_TIMEOUT_S,
+    )
+
+
+@lru_cache(maxsize=1)
+def _async_client():
+    import redis.asyncio  # noqa: PLC0415 - optional dependency
+
+    return redis.asyncio.Redis.from_url(
+        settings.job_runtime_cache_url,
+        socket_timeout=_SOCKET_TIMEOUT_S,
+        socket_connect_timeout=_SOCKET_TIMEOUT_S,
+    )
+
+
+async def get_job_runtime(job_id: str) -> bytes | None:
+    if not _enabled() or not _breaker.allow():
+        return None
+    try:
+        payload = await _async_client().get(_runtime_key(job_id))
+    except Exception:  # noqa: BLE001 - cache outage falls back to the database
+        _breaker.record_failure()
+        return None
+    _breaker.record_success()
+    return payload
+
+
+async def set_job_runtime(job_id: str, payload: str) -> None:
+    if not _enabled() or not _breaker.allow():
+        return
+    try:
+        await _async_client().set(_runtime_key(job_id), payload, px=settings.job_runtime_cache_ttl_ms)
+    except Exception:  # noqa: BLE001 - cache outage falls back to the database
+        _breaker.record_failure()
+        return
+    _breaker.record_success()
+
+
+def invalidate_job_runtime(job_id: str) -> None:
+    # Called after runtime writes commit; if Redis is down the entry still expires after the TTL.
+    if not _enabled() or not _breaker.allow():
+        return
+    try:
+        _sync_client().delete(_runtime_key(job_id))
+    except Exception:  # noqa: BLE001 - cache outage falls back to the database
+        _breaker.record_failure()
+        return
+    _breaker.record_success()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy as np
+
+from app._numba_support import NUMBA_AVAILABLE, jit
+
+# Serial on purpose: run_all_safety_checks already runs these side by side on its thread
+# pool, and parallel launches are serialized by the shared launch lock.
+
+
+@jit(cache=True)
+def count_changed(
+    base: np.ndarray,
+    cand: np.ndarray,
+    mask: np.ndarray,
+    thr: int,
+) -> tuple[int, int]:
+    """Single pass over base/cand/mask returning (changed_count, mask_count)."""
+    h, w = mask.shape
+    changed = 0
+    total = 0
+    for y in range(h):
+        for x in range(w):
+            if mask[y, x] == 0:
+                continue
+            total += 1
+            d = 0
+            for c in range(3):
+                # Branch on order so the uint8 subtraction never wraps.
+                a = base[y, x, c]
+                b = cand[y, x, c]
+                dc = a - b if a >= b else b - a
+                if dc > d:
+                    d = dc
+            if d > thr:
+                changed += 1
+    return changed, total
+
+
+@jit(cache=True)
+def gray_f32(img: np.ndarray) -> np.ndarray:
+    """float32 BT.601 luma on BGR input, same operation order as the NumPy path."""
+    h, w = img.shape[:2]
+    out = np.empty((h, w), dtype=np.float32)
+    wb = np.float32(0.114)
+    wg = np.float32(0.587)
+    wr = np.float32(0.299)
+    for y in range(h):
+        for x in range(w):
+            out[y, x] = (
+                np.float32(img[y, x, 0]) * wb
+                + np.float32(img[y, x, 1]) * wg
+                + np.float32(img[y, x, 2]) * wr
+            )
+    return out
+
+
+@jit(cache=True)
+def grad_l2(gray: np.ndarray) -> np.ndarray:
+    """Central-difference hypot(gx, gy) on a float32 plane; border terms stay zero."""
+    h, w = gray.shape
+    out = np.empty((h, w), dtype=np.float32)
+    for y in range(h):
+        for x in range(w):
+            gx = np.float32(0.0)
+            gy = np.float32(0.0)
+            if 0 < x < w - 1:
+                gx = gray[y, x + 1] - gray[y, x - 1]
+            if 0 < y < h - 1:
+                gy = gray[y + 1, x] - gray[y - 1, x]
+            out[y, x] = np.hypot(gx, gy)
+    return out
+
+
+@jit(cache=True)
+def region_stats(
+    img: np.ndarray,
+    grad: np.ndarray,
+    mask: np.ndarray,
+    edge_thr: float,
+) -> tuple[np.ndarray, np.ndarray, float, int, int]:
+    """One scan returning (sum_bgr, sumsq_bgr, sum_grad, edge_count, count) over mask."""
+    h, w = mask.shape
+    row_sum = np.zeros((h, 3), dtype=np.float64)
+    row_sumsq = np.zeros((h, 3), dtype=np.float64)
+    row_grad = np.zeros(h, dtype=np.float64)
+    row_edges = np.zeros(h, dtype=np.int64)
+    row_count = np.zeros(h, dtype=np.int64)
+    for y in range(h):
+        for x in range(w):
+            if not mask[y, x]:
+                continue
+            row_count[y] += 1
+            for c in range(3):
+                v = float(img[y, x, c])
+                row_sum[y, c] += v
+                row_sumsq[y, c] += v * v
+            g = grad[y, x]
+            row_grad[y] += g
+            if g >= edge_thr:
+                row_edges[y] += 1
+
+    sum_bgr = np.zeros(3, dtype=np.float64)
+    sumsq_bgr = np.zeros(3, dtype=np.float64)
+    sum_grad = 0.0
+    edges = 0
+    count = 0
+    for y in range(h):
+        for c in range(3):
+            sum_bgr[c] += row_sum[y, c]
+            sumsq_bgr[c] += row_sumsq[y, c]
+        sum_grad += row_grad[y]
+        edges += row_edges[y]
+        count += row_count[y]
+    return sum_bgr, sumsq_bgr, sum_grad, edges, count
+
+
+@jit(cache=True)
+def _count_true_u64(words: np.ndarray, tail: np.ndarray) -> int:
+    n = 0
+    for i in range(words.size):
+        # Bool bytes are 0/1: multiplying by 0x0101... sums the 8 bytes into the top byte.
+        n += ((words[i] & 0x0101010101010101) * 0x0101010101010101) >> 56
+    for i in range(tail.size):
+        if tail[i]:
+            n += 1
+    return n
+
+
+def count_true(mask: np.ndarray) -> int:
+    """Count non-zero entries of a mask, eight bytes per step when Numba is available."""
+    if not NUMBA_AVAILABLE:
+        return int(np.count_nonzero(mask))
+    flat = np.ascontiguousarray(mask, dtype=np.bool_).reshape(-1).view(np.uint8)
+    n_words = flat.size // 8
+    words = flat[: n_words * 8].view(np.uint64)
+    return int(_count_true_u64(words, flat[n_words * 8 :]))
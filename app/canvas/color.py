@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image
+
+
+def bgr_to_pil(image_bgr: np.ndarray) -> Image.Image:
+    """RGB PIL image from a BGR array; Pillow's raw "BGR" unpacker swaps channels in one C pass."""
+    h, w = image_bgr.shape[:2]
+    return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(image_bgr, dtype=np.uint8), "raw", "BGR", 0, 1)
+
+
+def pil_to_bgr(image: Image.Image) -> np.ndarray:
+    """Contiguous, writable BGR array from an RGB PIL image (no negative-stride view)."""
+    w, h = image.size
+    return np.frombuffer(bytearray(image.tobytes("raw", "BGR")), dtype=np.uint8).reshape(h, w, 3)
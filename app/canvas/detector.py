@@ -5,8 +5,8 @@ from functools import lru_cache
 from typing import Protocol
 
 import numpy as np
-from PIL import Image
 
+from app.canvas.color import bgr_to_pil
 from app.config import settings
 
 
@@ -28,6 +28,9 @@ class AnimalDetector(Protocol):
     def detect_animals(self, image_bgr: np.ndarray) -> list[Detection]:
         ...
 
+    def detect_animals_batch(self, images_bgr: list[np.ndarray]) -> list[list[Detection]]:
+        ...
+
 
 class NullAnimalDetector:
     """Fallback detector used when no model is wired yet."""
@@ -40,6 +43,9 @@ class NullAnimalDetector:
         _ = image_bgr
         return []
 
+    def detect_animals_batch(self, images_bgr: list[np.ndarray]) -> list[list[Detection]]:
+        return [[] for _ in images_bgr]
+
 
 class UltralyticsAnimalDetector:
     def __init__(self, model_name_or_path: str, confidence_threshold: float) -> None:
@@ -72,8 +78,23 @@ class UltralyticsAnimalDetector:
         )
         detections: list[Detection] = []
         for res in results:
-            if res.boxes is None:
-                continue
+            detections.extend(self._to_detections(res))
+        return detections
+
+    def detect_animals_batch(self, images_bgr: list[np.ndarray]) -> list[list[Detection]]:
+        if not images_bgr:
+            return []
+        # A list source is run as one batch; results come back in input order.
+        results = self._model.predict(
+            source=list(images_bgr),
+            conf=self._confidence_threshold,
+            verbose=False,
+        )
+        return [self._to_detections(res) for res in results]
+
+    def _to_detections(self, res) -> list[Detection]:
+        detections: list[Detection] = []
+        if res.boxes is not None:
             names = res.names or {}
             for box in res.boxes:
                 cls_idx = int(box.cls[0].item())
@@ -123,9 +144,18 @@ class TransformersAnimalDetector:
         return True
 
     def detect_animals(self, image_bgr: np.ndarray) -> list[Detection]:
-        image = Image.fromarray(image_bgr[:, :, ::-1], mode="RGB")
-        outputs = self._pipe(image)
-
+        image = bgr_to_pil(image_bgr)
+        return self._to_detections(self._pipe(image))
+
+    def detect_animals_batch(self, images_bgr: list[np.ndarray]) -> list[list[Detection]]:
+        if not images_bgr:
+            return []
+        images = [bgr_to_pil(image_bgr) for image_bgr in images_bgr]
+        # A list input returns one output list per image, in order.
+        outputs = self._pipe(images, batch_size=len(images))
+        return [self._to_detections(item_outputs) for item_outputs in outputs]
+
+    def _to_detections(self, outputs: list[dict]) -> list[Detection]:
         detections: list[Detection] = []
         for item in outputs:
             label = str(item.get("label", "")).lower()
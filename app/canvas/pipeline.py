@@ -1,32 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 import numpy as np
-from PIL import Image, ImageFilter
-
-from app.canvas.detector import AnimalDetector, create_default_detector
-from app.canvas.outpaint import (
-    MirrorOutpaintAdapter,
-    OutpaintAdapter,
-    create_default_outpaint_adapter,
-)
-from app.canvas.safety import (
-    check_generation_boundary_continuity,
-    check_generated_region_naturalness,
-    check_no_new_animals_in_generated_region,
-    check_protected_region_unchanged,
-)
-from app.canvas.types import CanvasBuildResult
+from PIL import Image
+
+from app.canvas.safety import SafetyCheckError, run_all_safety_checks
+from app.canvas.types import CanvasBuildResult, Placement
 from app.config import settings
 
+if TYPE_CHECKING:
+    from app.canvas.detector import AnimalDetector
+    from app.canvas.outpaint import OutpaintAdapter
+
+# run_all_safety_checks name -> (force-only message label, default failure reason)
+_SAFETY_CHECK_LABELS = {
+    "protected": ("protected-region", "protected region safety check failed"),
+    "animal": ("animal", "new-animal safety check failed"),
+    "boundary": ("boundary", "generation boundary safety check failed"),
+    "naturalness": ("naturalness", "generated region naturalness check failed"),
+}
+
+
+@lru_cache(maxsize=1)
+def _import_outpaint() -> ModuleType:
+    # Deferred: jobs that end on a safe-padding short-circuit never need it.
+    from app.canvas import outpaint  # noqa: PLC0415 - lazy import
+
+    return outpaint
+
+
+@lru_cache(maxsize=1)
+def _import_detector() -> ModuleType:
+    from app.canvas import detector  # noqa: PLC0415 - lazy import
 
-@dataclass(slots=True)
-class Placement:
-    x: int
-    y: int
-    width: int
-    height: int
+    return detector
 
 
 def _load_bgr(path: str) -> np.ndarray:
@@ -100,6 +110,8 @@ def _build_safe_background(
     if style == "blur":
         radius = max(0, int(settings.canvas_background_blur_radius))
         if radius > 0:
+            from PIL import ImageFilter  # noqa: PLC0415 - only needed for blur style
+
             cropped = cropped.filter(ImageFilter.GaussianBlur(radius=radius))
     return np.array(cropped, dtype=np.uint8)[:, :, ::-1]
 
@@ -204,13 +216,20 @@ def _harmonize_generated_region(
     if not region.any():
         return candidate_image_bgr
 
-    alpha *= region.astype(np.float32)
+    np.multiply(alpha, region, out=alpha)
     a3 = alpha[:, :, None]
-    mixed = (
-        candidate_image_bgr.astype(np.float32) * (1.0 - a3)
-        + safe_canvas_bgr.astype(np.float32) * a3
-    )
-    return np.clip(np.round(mixed), 0, 255).astype(np.uint8)
+    inv_a3 = np.subtract(1.0, a3)
+
+    # Step-wise in-place ops: one float32 scratch per input instead of a
+    # fresh HxWx3 temporary for every arithmetic operator.
+    mixed = candidate_image_bgr.astype(np.float32)
+    np.multiply(mixed, inv_a3, out=mixed)
+    scratch = safe_canvas_bgr.astype(np.float32)
+    np.multiply(scratch, a3, out=scratch)
+    np.add(mixed, scratch, out=mixed)
+    np.round(mixed, out=mixed)
+    np.clip(mixed, 0, 255, out=mixed)
+    return mixed.astype(np.uint8)
 
 
 def build_canvas_image(
@@ -229,6 +248,19 @@ def build_canvas_image(
     force_only = bool(settings.outpaint_force_only)
 
     source_bgr = _load_bgr(input_path)
+
+    # Already at target size: resize/background/compose would reproduce the input.
+    if source_bgr.shape[:2] == (target_h, target_w):
+        return CanvasBuildResult(
+            image=source_bgr,
+            used_outpaint=False,
+            adapter_name="none",
+            fallback_applied=False,
+            fallback_reason=None,
+            safety_passed=True,
+            safety_message="source matches target",
+        )
+
     resized_bgr, placement = _resize_with_aspect(source_bgr, target_w, target_h)
 
     safe_background = _build_safe_background(
@@ -267,7 +299,8 @@ def build_canvas_image(
     base_for_generation = safe_canvas.copy()
     protected_mask, generation_mask = _make_masks(target_w, target_h, placement)
 
-    adapter = outpaint_adapter or create_default_outpaint_adapter()
+    outpaint = _import_outpaint()
+    adapter = outpaint_adapter or outpaint.create_default_outpaint_adapter()
     adapter_name = type(adapter).__name__
     detector: AnimalDetector | None = animal_detector
     last_reason = "unknown outpaint failure"
@@ -303,93 +336,41 @@ def build_canvas_image(
                 placement,
             )
 
+        # Deterministic placeholder adapter does not synthesize new entities.
+        region_checks = not isinstance(adapter, outpaint.MirrorOutpaintAdapter)
+        if region_checks and enable_animal_detection and detector is None:
+            detector = _import_detector().create_default_detector()
+
         try:
-            protected_check = check_protected_region_unchanged(
+            failed_check, check_result = run_all_safety_checks(
                 base_for_generation,
                 candidate,
+                placement,
                 protected_mask,
+                generation_mask,
+                detector=detector if enable_animal_detection else None,
+                strict_mode=strict,
+                region_checks=region_checks,
             )
-        except ValueError as exc:
-            last_reason = f"protected region safety check error: {exc}"
+        except SafetyCheckError as exc:
+            last_reason = f"{_SAFETY_CHECK_LABELS[exc.check][0]} safety check error: {exc}"
             continue
-        if not protected_check.passed:
+        if failed_check is not None:
+            check_label, default_reason = _SAFETY_CHECK_LABELS[failed_check]
             if force_only:
                 return CanvasBuildResult(
                     image=candidate,
                     used_outpaint=True,
                     adapter_name=adapter_name,
                     fallback_applied=False,
-                    fallback_reason=protected_check.reason,
+                    fallback_reason=check_result.reason,
                     safety_passed=False,
-                    safety_message="force outpaint accepted (protected-region check failed)",
+                    safety_message=f"force outpaint accepted ({check_label} check failed)",
                 )
-            last_reason = protected_check.reason or "protected region safety check failed"
+            last_reason = check_result.reason or default_reason
             continue
-
-        # Deterministic placeholder adapter does not synthesize new entities.
-        if not isinstance(adapter, MirrorOutpaintAdapter):
-            if enable_animal_detection:
-                if detector is None:
-                    detector = create_default_detector()
-                animal_check = check_no_new_animals_in_generated_region(
-                    candidate,
-                    generation_mask,
-                    detector,
-                    strict_mode=strict,
-                )
-                if not animal_check.passed:
-                    if force_only:
-                        return CanvasBuildResult(
-                            image=candidate,
-                            used_outpaint=True,
-                            adapter_name=adapter_name,
-                            fallback_applied=False,
-                            fallback_reason=animal_check.reason,
-                            safety_passed=False,
-                            safety_message="force outpaint accepted (animal check failed)",
-                        )
-                    last_reason = animal_check.reason or "new-animal safety check failed"
-                    continue
-
-            boundary_check = check_generation_boundary_continuity(
-                candidate,
-                protected_mask,
-                generation_mask,
-            )
-            if not boundary_check.passed:
-                if force_only:
-                    return CanvasBuildResult(
-                        image=candidate,
-                        used_outpaint=True,
-                        adapter_name=adapter_name,
-                        fallback_applied=False,
-                        fallback_reason=boundary_check.reason,
-                        safety_passed=False,
-                        safety_message="force outpaint accepted (boundary check failed)",
-                    )
-                last_reason = boundary_check.reason or "generation boundary safety check failed"
-                continue
-
-            naturalness_check = check_generated_region_naturalness(
-                candidate,
-                protected_mask,
-                generation_mask,
-            )
-            if not naturalness_check.passed:
-                if force_only:
-                    return CanvasBuildResult(
-                        image=candidate,
-                        used_outpaint=True,
-                        adapter_name=adapter_name,
-                        fallback_applied=False,
-                        fallback_reason=naturalness_check.reason,
-                        safety_passed=False,
-                        safety_message="force outpaint accepted (naturalness check failed)",
-                    )
-                last_reason = naturalness_check.reason or "generated region naturalness check failed"
-                continue
-
-        if isinstance(adapter, MirrorOutpaintAdapter):
+
+        if isinstance(adapter, outpaint.MirrorOutpaintAdapter):
             if force_only:
                 raise RuntimeError(
                     "OUTPAINT_FORCE_ONLY=true but MirrorOutpaintAdapter was selected"
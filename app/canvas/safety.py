@@ -1,16 +1,60 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 
-from app.canvas.detector import AnimalDetector
+from app.canvas.types import Placement
+
+if TYPE_CHECKING:
+    from app.canvas.detector import AnimalDetector
 
 
 @dataclass(slots=True)
 class SafetyCheckResult:
     passed: bool
-    reason: str | None = None
+    reason_template: str | None = None
+    reason_args: tuple[object, ...] = ()
+
+    @property
+    def reason(self) -> str | None:
+        # Formatted on access so callers that only check `passed` skip the string work.
+        if self.reason_template is None or not self.reason_args:
+            return self.reason_template
+        return self.reason_template.format(*self.reason_args)
+
+
+def _as_bool_mask(mask: np.ndarray) -> np.ndarray:
+    # Contiguous bool masks hit NumPy's boolean-subscript fast path; uint8 masks are 0/255.
+    return np.ascontiguousarray(mask.astype(bool, copy=False))
+
+
+_SPARSE_MASK_RATIO = 0.05
+
+
+@lru_cache(maxsize=1)
+def _kernels() -> ModuleType:
+    # Deferred: importing the kernels loads Numba, which pipeline's import of this module must not pay.
+    from app.canvas import _safety_kernels  # noqa: PLC0415 - lazy import
+
+    return _safety_kernels
+
+
+def _absdiff_u8(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # |a - b| computed in uint8 (max - min never wraps), avoiding two int16 copies.
+    diff = np.maximum(a, b)
+    np.subtract(diff, np.minimum(a, b), out=diff)
+    return diff
+
+
+def _channel_max(diff: np.ndarray) -> np.ndarray:
+    # Two binary np.maximum calls on the 3 channels beat the generic axis reduction.
+    out = np.maximum(diff[..., 0], diff[..., 1])
+    return np.maximum(out, diff[..., 2], out=out)
 
 
 def _count_changed_pixels(
@@ -29,14 +73,34 @@ def _count_changed_pixels(
             "mask shape mismatch: "
             f"mask={mask.shape}, base_hw={base_image_bgr.shape[:2]}"
         )
+
+    if _kernels().NUMBA_AVAILABLE:
+        changed_count, total_count = _kernels().count_changed(
+            np.ascontiguousarray(base_image_bgr),
+            np.ascontiguousarray(candidate_image_bgr),
+            np.ascontiguousarray(mask),
+            int(diff_threshold),
+        )
+        return int(changed_count), int(total_count)
+
+    mask_bool = _as_bool_mask(mask)
+    total_count = _kernels().count_true(mask_bool)
+    if total_count == 0:
+        return 0, 0
+
+    if total_count < _SPARSE_MASK_RATIO * mask_bool.size:
+        # Sparse mask: diff only the gathered K x 3 pixels instead of the full frame.
+        ys, xs = np.nonzero(mask_bool)
+        diff = _absdiff_u8(base_image_bgr[ys, xs], candidate_image_bgr[ys, xs])
+        changed_count = int(np.count_nonzero(_channel_max(diff) > diff_threshold))
+        return changed_count, total_count
 
     # Per-pixel absolute difference, max over channels.
-    diff = np.abs(candidate_image_bgr.astype(np.int16) - base_image_bgr.astype(np.int16))
-    diff_max = diff.max(axis=2)
-    changed = (diff_max > diff_threshold) & (mask > 0)
+    diff = _absdiff_u8(base_image_bgr, candidate_image_bgr)
+    diff_max = _channel_max(diff)
+    changed = (diff_max > diff_threshold) & mask_bool
 
-    changed_count = int(changed.sum())
-    total_count = int((mask > 0).sum())
+    changed_count = _kernels().count_true(changed)
     return changed_count, total_count
 
 
@@ -55,20 +119,53 @@ def check_protected_region_unchanged(
         diff_threshold=diff_threshold,
     )
     if total == 0:
-        return SafetyCheckResult(passed=False, reason="protected mask is empty")
+        return SafetyCheckResult(passed=False, reason_template="protected mask is empty")
 
     ratio = changed / total
     if ratio > max_changed_ratio:
         return SafetyCheckResult(
             passed=False,
-            reason=(
-                f"protected region changed too much: ratio={ratio:.6f}, "
-                f"threshold={max_changed_ratio:.6f}"
-            ),
+            reason_template="protected region changed too much: ratio={:.6f}, threshold={:.6f}",
+            reason_args=(ratio, max_changed_ratio),
         )
     return SafetyCheckResult(passed=True)
 
 
+def check_protected_region_unchanged_rect(
+    base_image_bgr: np.ndarray,
+    candidate_image_bgr: np.ndarray,
+    placement: Placement,
+    *,
+    max_changed_ratio: float = 0.001,
+    diff_threshold: int = 8,
+) -> SafetyCheckResult:
+    """Rectangle variant of `check_protected_region_unchanged`."""
+    if base_image_bgr.shape != candidate_image_bgr.shape:
+        raise ValueError(
+            "base_image_bgr and candidate_image_bgr shape mismatch: "
+            f"base={base_image_bgr.shape}, candidate={candidate_image_bgr.shape}"
+        )
+
+    rows = slice(placement.y, placement.y + placement.height)
+    cols = slice(placement.x, placement.x + placement.width)
+    base_region = base_image_bgr[rows, cols]
+    candidate_region = candidate_image_bgr[rows, cols]
+    if base_region.size == 0:
+        return SafetyCheckResult(passed=False, reason_template="protected mask is empty")
+
+    # Exact match (memcmp) is the common case right after the rectangle is copied back.
+    if np.array_equal(base_region, candidate_region):
+        return SafetyCheckResult(passed=True)
+
+    return check_protected_region_unchanged(
+        base_region,
+        candidate_region,
+        np.ones(base_region.shape[:2], dtype=np.uint8),
+        max_changed_ratio=max_changed_ratio,
+        diff_threshold=diff_threshold,
+    )
+
+
 def check_no_new_animals_in_generated_region(
     candidate_image_bgr: np.ndarray,
     generation_mask: np.ndarray,
@@ -77,39 +174,58 @@ def check_no_new_animals_in_generated_region(
     strict_mode: bool,
 ) -> SafetyCheckResult:
     if generation_mask.shape != candidate_image_bgr.shape[:2]:
-        return SafetyCheckResult(passed=False, reason="generation mask shape mismatch")
+        return SafetyCheckResult(passed=False, reason_template="generation mask shape mismatch")
 
     if not detector.available:
-        if strict_mode and int((generation_mask > 0).sum()) > 0:
+        if strict_mode and generation_mask.any():
             return SafetyCheckResult(
                 passed=False,
-                reason="animal detector unavailable in strict mode",
+                reason_template="animal detector unavailable in strict mode",
             )
         return SafetyCheckResult(passed=True)
 
     detections = detector.detect_animals(candidate_image_bgr)
-    for det in detections:
-        # If detection bbox intersects generated region, treat as policy violation.
-        x1 = max(0, min(det.x1, candidate_image_bgr.shape[1] - 1))
-        y1 = max(0, min(det.y1, candidate_image_bgr.shape[0] - 1))
-        x2 = max(0, min(det.x2, candidate_image_bgr.shape[1]))
-        y2 = max(0, min(det.y2, candidate_image_bgr.shape[0]))
-        if x2 <= x1 or y2 <= y1:
-            continue
-
-        region = generation_mask[y1:y2, x1:x2]
-        if int((region > 0).sum()) > 0:
-            return SafetyCheckResult(
-                passed=False,
-                reason=(
-                    f"new animal detected in generated region: "
-                    f"{det.label}({det.confidence:.2f})"
-                ),
-            )
+    if not detections:
+        return SafetyCheckResult(passed=True)
+
+    # Clamp every bbox in one vectorized pass instead of per-detection min/max calls.
+    h, w = candidate_image_bgr.shape[:2]
+    boxes = np.array([[d.x1, d.y1, d.x2, d.y2] for d in detections], dtype=np.int64)
+    np.clip(boxes, 0, [w - 1, h - 1, w, h], out=boxes)
+    x1, y1, x2, y2 = boxes.T
+
+    # Zero-padded integral image: each bbox's generated-pixel count is a 4-sample lookup.
+    integral = np.zeros((h + 1, w + 1), dtype=np.uint32)
+    np.cumsum(_as_bool_mask(generation_mask), axis=0, dtype=np.uint32, out=integral[1:, 1:])
+    np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+    counts = (
+        integral[y2, x2].astype(np.int64)
+        - integral[y1, x2]
+        - integral[y2, x1]
+        + integral[y1, x1]
+    )
+
+    # If detection bbox intersects generated region, treat as policy violation.
+    hits = np.flatnonzero((x2 > x1) & (y2 > y1) & (counts > 0))
+    if hits.size:
+        det = detections[int(hits[0])]
+        return SafetyCheckResult(
+            passed=False,
+            reason_template="new animal detected in generated region: {}({:.2f})",
+            reason_args=(det.label, det.confidence),
+        )
 
     return SafetyCheckResult(passed=True)
 
 
+def _pair_diff_max(image_bgr: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    # Only gather the (x, x + 1) pixel pairs flagged in `pairs` instead of
+    # differencing the whole image.
+    ys, xs = np.nonzero(pairs)
+    diff = _absdiff_u8(image_bgr[ys, xs], image_bgr[ys, xs + 1])
+    return _channel_max(diff).astype(np.float32)
+
+
 def check_generation_boundary_continuity(
     candidate_image_bgr: np.ndarray,
     protected_mask: np.ndarray,
@@ -120,30 +236,27 @@ def check_generation_boundary_continuity(
     min_pair_count: int = 120,
 ) -> SafetyCheckResult:
     if protected_mask.shape != candidate_image_bgr.shape[:2]:
-        return SafetyCheckResult(passed=False, reason="protected mask shape mismatch")
+        return SafetyCheckResult(passed=False, reason_template="protected mask shape mismatch")
     if generation_mask.shape != candidate_image_bgr.shape[:2]:
-        return SafetyCheckResult(passed=False, reason="generation mask shape mismatch")
+        return SafetyCheckResult(passed=False, reason_template="generation mask shape mismatch")
 
     h, w = candidate_image_bgr.shape[:2]
     if h == 0 or w < 2:
         return SafetyCheckResult(passed=True)
 
-    protected = protected_mask > 0
-    gen = generation_mask > 0
+    protected = _as_bool_mask(protected_mask)
+    gen = _as_bool_mask(generation_mask)
     if not gen.any():
         return SafetyCheckResult(passed=True)
 
     left_pairs = gen[:, :-1] & protected[:, 1:]
     right_pairs = protected[:, :-1] & gen[:, 1:]
 
-    diff = np.abs(candidate_image_bgr[:, :-1, :].astype(np.int16) - candidate_image_bgr[:, 1:, :].astype(np.int16))
-    diff_max = diff.max(axis=2).astype(np.float32)
-
     values = []
     if left_pairs.any():
-        values.append(diff_max[left_pairs])
+        values.append(_pair_diff_max(candidate_image_bgr, left_pairs))
     if right_pairs.any():
-        values.append(diff_max[right_pairs])
+        values.append(_pair_diff_max(candidate_image_bgr, right_pairs))
     if not values:
         return SafetyCheckResult(passed=True)
 
@@ -153,22 +266,29 @@ def check_generation_boundary_continuity(
         return SafetyCheckResult(passed=True)
 
     mean_diff = float(boundary_diff.mean())
-    p95_diff = float(np.percentile(boundary_diff, 95.0))
+    # Single-quantile selection (introselect) instead of a full sort.
+    k = max(0, min(pair_count - 1, int(round(0.95 * (pair_count - 1)))))
+    p95_diff = float(np.partition(boundary_diff, k)[k])
 
     if mean_diff > max_mean_diff or p95_diff > max_p95_diff:
         return SafetyCheckResult(
             passed=False,
-            reason=(
+            reason_template=(
                 "generation boundary mismatch: "
-                f"mean_diff={mean_diff:.4f}, p95_diff={p95_diff:.4f}, pairs={pair_count}, "
-                f"limit_mean={max_mean_diff:.4f}, limit_p95={max_p95_diff:.4f}"
+                "mean_diff={:.4f}, p95_diff={:.4f}, pairs={}, "
+                "limit_mean={:.4f}, limit_p95={:.4f}"
             ),
+            reason_args=(mean_diff, p95_diff, pair_count, max_mean_diff, max_p95_diff),
         )
 
     return SafetyCheckResult(passed=True)
 
 
 def _gray(image_bgr: np.ndarray) -> np.ndarray:
+    # float32 on purpose: rounding luma to 8 bits shifts the edge-density ratios enough to
+    # flip naturalness verdicts.
+    if _kernels().NUMBA_AVAILABLE:
+        return _kernels().gray_f32(image_bgr)
     return (
         image_bgr[:, :, 0].astype(np.float32) * 0.114
         + image_bgr[:, :, 1].astype(np.float32) * 0.587
@@ -177,11 +297,41 @@ def _gray(image_bgr: np.ndarray) -> np.ndarray:
 
 
 def _grad_magnitude(gray: np.ndarray) -> np.ndarray:
-    gx = np.zeros_like(gray, dtype=np.float32)
-    gy = np.zeros_like(gray, dtype=np.float32)
-    gx[:, 1:-1] = gray[:, 2:] - gray[:, :-2]
-    gy[1:-1, :] = gray[2:, :] - gray[:-2, :]
-    return np.hypot(gx, gy)
+    # Euclidean magnitude: the edge threshold was tuned on it, and an L1 stand-in only matches
+    # on average, not on the sparse axis-aligned edges the check is meant to catch.
+    if _kernels().NUMBA_AVAILABLE:
+        return _kernels().grad_l2(gray)
+
+    gx = np.zeros(gray.shape, dtype=np.float32)
+    gy = np.zeros(gray.shape, dtype=np.float32)
+    # Borders stay zero; interior differences are written straight into the buffers.
+    np.subtract(gray[:, 2:], gray[:, :-2], out=gx[:, 1:-1])
+    np.subtract(gray[2:, :], gray[:-2, :], out=gy[1:-1, :])
+    return np.hypot(gx, gy, out=gx)
+
+
+class SafetyContext:
+    """Per-candidate cache so gray/gradient planes are computed once across checks."""
+
+    __slots__ = ("image", "_gray", "_grad")
+
+    def __init__(self, image_bgr: np.ndarray) -> None:
+        self.image = image_bgr
+        self._gray: np.ndarray | None = None
+        self._grad: np.ndarray | None = None
+
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            self._gray = _gray(self.image)
+        return self._gray
+
+    def grad(self) -> np.ndarray:
+        if self._grad is None:
+            self._grad = _grad_magnitude(self.gray())
+        return self._grad
+
+
+_EDGE_GRAD_THRESHOLD = 26.0
 
 
 def _masked_region_stats(
@@ -191,7 +341,29 @@ def _masked_region_stats(
 ) -> tuple[np.ndarray, np.ndarray, float, float, int] | None:
     if mask.shape != image_bgr.shape[:2]:
         return None
-    count = int(mask.sum())
+
+    if _kernels().NUMBA_AVAILABLE:
+        # Column-slab views are passed as-is; the kernel handles strided input.
+        sum_bgr, sumsq_bgr, sum_grad, edges, kernel_count = _kernels().region_stats(
+            image_bgr,
+            grad,
+            mask,
+            _EDGE_GRAD_THRESHOLD,
+        )
+        count = int(kernel_count)
+        if count <= 0:
+            return None
+        mean64 = sum_bgr / count
+        std64 = np.sqrt(np.maximum(sumsq_bgr / count - mean64 * mean64, 0.0))
+        return (
+            mean64.astype(np.float32),
+            std64.astype(np.float32),
+            float(sum_grad / count),
+            float(edges / count),
+            count,
+        )
+
+    count = _kernels().count_true(mask)
     if count <= 0:
         return None
 
@@ -201,10 +373,22 @@ def _masked_region_stats(
     mean = pixels.mean(axis=0).astype(np.float32)
     std = pixels.std(axis=0).astype(np.float32)
     grad_mean = float(grad_vals.mean())
-    edge_density = float((grad_vals >= 26.0).mean())
+    edge_density = float(np.count_nonzero(grad_vals >= _EDGE_GRAD_THRESHOLD) / count)
     return mean, std, grad_mean, edge_density, count
 
 
+def _column_band_stats(
+    image_bgr: np.ndarray,
+    grad: np.ndarray,
+    mask: np.ndarray,
+    col_start: int,
+    col_end: int,
+) -> tuple[np.ndarray, np.ndarray, float, float, int] | None:
+    # Regions are column bands, so slice first and scan only the narrower slab.
+    cols = slice(col_start, col_end)
+    return _masked_region_stats(image_bgr[:, cols], grad[:, cols], mask[:, cols])
+
+
 def check_generated_region_naturalness(
     candidate_image_bgr: np.ndarray,
     protected_mask: np.ndarray,
@@ -216,41 +400,41 @@ def check_generated_region_naturalness(
     max_std_delta_norm: float = 0.36,
     max_grad_ratio: float = 3.0,
     max_edge_density_ratio: float = 3.5,
+    context: SafetyContext | None = None,
 ) -> SafetyCheckResult:
     if protected_mask.shape != candidate_image_bgr.shape[:2]:
-        return SafetyCheckResult(passed=False, reason="protected mask shape mismatch")
+        return SafetyCheckResult(passed=False, reason_template="protected mask shape mismatch")
     if generation_mask.shape != candidate_image_bgr.shape[:2]:
-        return SafetyCheckResult(passed=False, reason="generation mask shape mismatch")
+        return SafetyCheckResult(passed=False, reason_template="generation mask shape mismatch")
 
     h, w = candidate_image_bgr.shape[:2]
     if h == 0 or w == 0:
         return SafetyCheckResult(passed=True)
 
-    protected = protected_mask > 0
-    generation = generation_mask > 0
-    if not generation.any() or not protected.any():
+    protected = _as_bool_mask(protected_mask)
+    generation = _as_bool_mask(generation_mask)
+    if not generation.any():
         return SafetyCheckResult(passed=True)
 
-    gray = _gray(candidate_image_bgr)
-    grad = _grad_magnitude(gray)
-    x = np.arange(w)[None, :]
-
-    protected_cols = np.where(protected.any(axis=0))[0]
+    # Column indices come back sorted, so the bounds are the first/last entries.
+    protected_cols = np.flatnonzero(protected.any(axis=0))
     if protected_cols.size == 0:
         return SafetyCheckResult(passed=True)
 
-    left_boundary = int(protected_cols.min())
-    right_boundary = int(protected_cols.max()) + 1
+    left_boundary = int(protected_cols[0])
+    right_boundary = int(protected_cols[-1]) + 1
+
+    if context is None or context.image is not candidate_image_bgr:
+        context = SafetyContext(candidate_image_bgr)
+    grad = context.grad()
 
     side_failures: list[str] = []
 
     # Left generated side vs adjacent protected band
     if left_boundary > 0:
-        left_gen = generation & (x < left_boundary)
         left_ref_end = min(w, left_boundary + ref_band_width)
-        left_ref = protected & (x >= left_boundary) & (x < left_ref_end)
-        gen_stats = _masked_region_stats(candidate_image_bgr, grad, left_gen)
-        ref_stats = _masked_region_stats(candidate_image_bgr, grad, left_ref)
+        gen_stats = _column_band_stats(candidate_image_bgr, grad, generation, 0, left_boundary)
+        ref_stats = _column_band_stats(candidate_image_bgr, grad, protected, left_boundary, left_ref_end)
         if gen_stats is not None and ref_stats is not None:
             g_mean, g_std, g_grad_mean, g_edge_density, g_count = gen_stats
             r_mean, r_std, r_grad_mean, r_edge_density, r_count = ref_stats
@@ -279,11 +463,9 @@ def check_generated_region_naturalness(
 
     # Right generated side vs adjacent protected band
     if right_boundary < w:
-        right_gen = generation & (x >= right_boundary)
         right_ref_start = max(0, right_boundary - ref_band_width)
-        right_ref = protected & (x >= right_ref_start) & (x < right_boundary)
-        gen_stats = _masked_region_stats(candidate_image_bgr, grad, right_gen)
-        ref_stats = _masked_region_stats(candidate_image_bgr, grad, right_ref)
+        gen_stats = _column_band_stats(candidate_image_bgr, grad, generation, right_boundary, w)
+        ref_stats = _column_band_stats(candidate_image_bgr, grad, protected, right_ref_start, right_boundary)
         if gen_stats is not None and ref_stats is not None:
             g_mean, g_std, g_grad_mean, g_edge_density, g_count = gen_stats
             r_mean, r_std, r_grad_mean, r_edge_density, r_count = ref_stats
@@ -313,7 +495,104 @@ def check_generated_region_naturalness(
     if side_failures:
         return SafetyCheckResult(
             passed=False,
-            reason="generated region unnatural: " + ", ".join(side_failures),
+            reason_template="generated region unnatural: " + ", ".join(side_failures),
         )
 
     return SafetyCheckResult(passed=True)
+
+
+class SafetyCheckError(ValueError):
+    """A check raised on its inputs; `check` is its run_all_safety_checks name."""
+
+    def __init__(self, check: str, message: str) -> None:
+        super().__init__(message)
+        self.check = check
+
+
+def _run_named_check(name: str, check: Callable[[], SafetyCheckResult]) -> SafetyCheckResult:
+    try:
+        return check()
+    except ValueError as exc:
+        raise SafetyCheckError(name, str(exc)) from exc
+
+
+@lru_cache(maxsize=1)
+def _safety_executor() -> ThreadPoolExecutor:
+    # Created on first use so forked workers never inherit a live pool.
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="safety-check")
+
+
+def run_all_safety_checks(
+    base_image_bgr: np.ndarray,
+    candidate_image_bgr: np.ndarray,
+    placement: Placement,
+    protected_mask: np.ndarray,
+    generation_mask: np.ndarray,
+    *,
+    detector: AnimalDetector | None,
+    strict_mode: bool,
+    region_checks: bool = True,
+) -> tuple[str | None, SafetyCheckResult]:
+    """Run the candidate checks concurrently; returns (failed check name or None, result)."""
+    context = SafetyContext(candidate_image_bgr)
+    checks: list[tuple[str, Callable[[], SafetyCheckResult]]] = [
+        (
+            "protected",
+            partial(
+                check_protected_region_unchanged_rect,
+                base_image_bgr,
+                candidate_image_bgr,
+                placement,
+            ),
+        ),
+    ]
+    if region_checks:
+        if detector is not None:
+            checks.append((
+                "animal",
+                partial(
+                    check_no_new_animals_in_generated_region,
+                    candidate_image_bgr,
+                    generation_mask,
+                    detector,
+                    strict_mode=strict_mode,
+                ),
+            ))
+        checks.append((
+            "boundary",
+            partial(
+                check_generation_boundary_continuity,
+                candidate_image_bgr,
+                protected_mask,
+                generation_mask,
+            ),
+        ))
+        checks.append((
+            "naturalness",
+            partial(
+                check_generated_region_naturalness,
+                candidate_image_bgr,
+                protected_mask,
+                generation_mask,
+                context=context,
+            ),
+        ))
+
+    if len(checks) == 1:
+        name, check = checks[0]
+        result = _run_named_check(name, check)
+        return (None if result.passed else name), result
+
+    # The heavy NumPy/Numba work releases the GIL, so the checks overlap on threads.
+    # Results are read in submission order so the reported failure matches a serial run.
+    executor = _safety_executor()
+    futures = [(name, executor.submit(_run_named_check, name, check)) for name, check in checks]
+    try:
+        for name, future in futures:
+            result = future.result()
+            if not result.passed:
+                return name, result
+    finally:
+        for _name, future in futures:
+            future.cancel()
+    return None, SafetyCheckResult(passed=True)
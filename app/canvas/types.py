@@ -5,6 +5,14 @@ from dataclasses import dataclass
 import numpy as np
 
 
+@dataclass(slots=True)
+class Placement:
+    x: int
+    y: int
+    width: int
+    height: int
+
+
 @dataclass(slots=True)
 class CanvasBuildResult:
     image: np.ndarray
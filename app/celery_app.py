@@ -1,6 +1,9 @@
 from celery import Celery
+from celery.signals import worker_process_init
 
 from app.config import settings
+from app.db import engine
+from app.video.ffmpeg import video_encoder_args
 
 
 celery_app = Celery(
@@ -10,9 +13,32 @@ celery_app = Celery(
     include=["app.tasks"],
 )
 
+# Model-loading (GPU/CPU heavy) tasks get their own queue so a dedicated worker pool can be sized for them.
+_PIPELINE_TASKS = (
+    "app.tasks.run_canvas_render",
+    "app.tasks.run_transition_render",
+    "app.tasks.run_pipeline_render",
+)
+
 celery_app.conf.update(
     task_default_queue="default",
+    task_routes={name: {"queue": settings.celery_pipeline_queue} for name in _PIPELINE_TASKS},
+    # Renders run for minutes; do not reserve extra messages behind a busy process.
+    worker_prefetch_multiplier=1,
     task_track_started=True,
     timezone="UTC",
     enable_utc=True,
 )
+
+
+@worker_process_init.connect
+def _reset_db_pool(**_kwargs) -> None:
+    # Prefork children inherit the parent's pooled connections; drop them (without closing
+    # the parent's sockets) so each child checks out its own.
+    engine.dispose(close=False)
+
+
+@worker_process_init.connect
+def _detect_hw_encoder(**_kwargs) -> None:
+    # Probe once per worker process up front instead of inside the first render.
+    video_encoder_args()
@@ -1,6 +1,10 @@
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, Update, case, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 
+from app import cache
 from app.models import Asset, Job, JobRuntime, JobStatus, Project, ProjectRun, ProjectStatus
 
 
@@ -29,17 +33,59 @@ def get_job_runtime(db: Session, job_id: str) -> JobRuntime | None:
     return db.get(JobRuntime, job_id)
 
 
-def list_job_runtimes(db: Session, job_ids: list[str]) -> dict[str, JobRuntime]:
-    if not job_ids:
-        return {}
-    stmt = select(JobRuntime).where(JobRuntime.job_id.in_(job_ids))
-    rows = list(db.scalars(stmt))
-    return {row.job_id: row for row in rows}
+# Runtime fields shown in job listings; the timestamps are never serialized there.
+_RUNTIME_SUMMARY_COLUMNS = load_only(
+    JobRuntime.stage,
+    JobRuntime.progress_percent,
+    JobRuntime.detail_message,
+    JobRuntime.cancel_requested,
+)
 
 
-def list_jobs(db: Session, limit: int = 20) -> list[Job]:
-    stmt = select(Job).order_by(Job.created_at.desc()).limit(limit)
-    return list(db.scalars(stmt))
+def _jobs_with_runtime_stmt(limit: int) -> Select:
+    return (
+        select(Job, JobRuntime)
+        .outerjoin(JobRuntime, JobRuntime.job_id == Job.id)
+        .options(_RUNTIME_SUMMARY_COLUMNS)
+        .order_by(Job.created_at.desc())
+        .limit(limit)
+    )
+
+
+async def get_job_async(db: AsyncSession, job_id: str) -> Job | None:
+    return await db.get(Job, job_id)
+
+
+async def get_job_runtime_async(db: AsyncSession, job_id: str) -> JobRuntime | None:
+    return await db.get(JobRuntime, job_id)
+
+
+async def list_jobs_with_runtime_async(
+    db: AsyncSession, limit: int = 20
+) -> list[tuple[Job, JobRuntime | None]]:
+    return [tuple(row) for row in await db.execute(_jobs_with_runtime_stmt(limit))]
+
+
+def _runtime_status_update(status: JobStatus, error_message: str | None) -> Update | None:
+    # Mirrors the runtime stage/progress bookkeeping for a job status change as one UPDATE.
+    stmt = update(JobRuntime)
+    progress = JobRuntime.progress_percent
+    if status == JobStatus.PROCESSING:
+        return stmt.values(
+            stage=case((JobRuntime.stage == "queued", "processing"), else_=JobRuntime.stage),
+            progress_percent=case((progress < 1, 1), (progress > 99, 99), else_=progress),
+        )
+    if status == JobStatus.SUCCEEDED:
+        return stmt.values(stage="completed", progress_percent=100)
+    if status == JobStatus.FAILED:
+        values = {
+            "stage": "failed",
+            "progress_percent": case((progress > 99, 99), else_=progress),
+        }
+        if error_message:
+            values["detail_message"] = error_message
+        return stmt.where(JobRuntime.stage != "canceled").values(**values)
+    return None
 
 
 def set_job_status(
@@ -50,39 +96,41 @@ def set_job_status(
     error_message: str | None = None,
     result_message: str | None = None,
 ) -> Job:
-    job = get_job(db, job_id)
-    if job is None:
-        raise ValueError(f"Job not found: {job_id}")
-
-    job.status = status
+    job_values: dict[str, object] = {"status": status}
     if error_message is not None:
-        job.error_message = error_message
+        job_values["error_message"] = error_message
     if result_message is not None:
-        job.result_message = result_message
+        job_values["result_message"] = result_message
+
+    # Job and runtime rows change in one transaction (single commit); the commit
+    # expires cached instances, so skipping ORM session synchronization is safe.
+    no_sync = {"synchronize_session": False}
+    try:
+        result = db.execute(
+            update(Job).where(Job.id == job_id).values(**job_values),
+            execution_options=no_sync,
+        )
+        if result.rowcount == 0:
+            raise ValueError(f"Job not found: {job_id}")
+        runtime_stmt = _runtime_status_update(status, error_message)
+        if runtime_stmt is not None:
+            db.execute(
+                runtime_stmt.where(JobRuntime.job_id == job_id),
+                execution_options=no_sync,
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
-    db.add(job)
-    db.commit()
-    db.refresh(job)
+    cache.invalidate_job_runtime(job_id)
+    return db.get(Job, job_id)
 
-    runtime = get_job_runtime(db, job_id)
-    if runtime is not None:
-        if status == JobStatus.PROCESSING:
-            if runtime.stage == "queued":
-                runtime.stage = "processing"
-            runtime.progress_percent = max(1, min(99, runtime.progress_percent))
-        elif status == JobStatus.SUCCEEDED:
-            runtime.stage = "completed"
-            runtime.progress_percent = 100
-        elif status == JobStatus.FAILED and runtime.stage not in {"canceled"}:
-            runtime.stage = "failed"
-            runtime.progress_percent = min(99, runtime.progress_percent)
-            if error_message:
-                runtime.detail_message = error_message
-        db.add(runtime)
-        db.commit()
-        db.refresh(runtime)
 
-    return job
+_UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 
 
 def upsert_job_runtime(
@@ -94,6 +142,33 @@ def upsert_job_runtime(
     detail_message: str | None = None,
     cancel_requested: bool | None = None,
 ) -> JobRuntime:
+    values: dict[str, object] = {}
+    if stage is not None:
+        values["stage"] = stage
+    if progress_percent is not None:
+        values["progress_percent"] = max(0, min(100, int(progress_percent)))
+    if detail_message is not None:
+        values["detail_message"] = detail_message
+    if cancel_requested is not None:
+        values["cancel_requested"] = cancel_requested
+
+    insert_fn = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert_fn is not None:
+        # One INSERT .. ON CONFLICT DO UPDATE .. RETURNING round trip instead of select-then-write.
+        insert_values = {"stage": "queued", "progress_percent": 0, "cancel_requested": False, **values}
+        stmt = insert_fn(JobRuntime).values(job_id=job_id, **insert_values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobRuntime.job_id],
+            set_={**values, "updated_at": func.now()},
+        ).returning(JobRuntime)
+        runtime = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        # RETURNING loaded every column; detach so the commit does not expire them and the
+        # caller's attribute reads do not cost a second SELECT.
+        db.expunge(runtime)
+        db.commit()
+        cache.invalidate_job_runtime(job_id)
+        return runtime
+
     runtime = get_job_runtime(db, job_id)
     if runtime is None:
         runtime = JobRuntime(job_id=job_id, stage="queued", progress_percent=0, cancel_requested=False)
@@ -110,6 +185,7 @@ def upsert_job_runtime(
     db.add(runtime)
     db.commit()
     db.refresh(runtime)
+    cache.invalidate_job_runtime(job_id)
     return runtime
 
 
@@ -228,6 +304,20 @@ def add_asset(
     return asset
 
 
+def bulk_add_assets(db: Session, project_id: str, rows: list[dict[str, object]]) -> list[Asset]:
+    # rows carry order_index/file_name/file_path/width/height; one executemany INSERT .. RETURNING and one commit.
+    if not rows:
+        return []
+    stmt = insert(Asset).returning(Asset, sort_by_parameter_order=True)
+    assets = list(db.scalars(stmt, [{**row, "project_id": project_id} for row in rows]))
+    # RETURNING already loaded every column; detach so the commit does not expire them
+    # (which would cost one refresh SELECT per asset when the caller serializes them).
+    for asset in assets:
+        db.expunge(asset)
+    db.commit()
+    return assets
+
+
 def list_assets_by_project(db: Session, project_id: str) -> list[Asset]:
     stmt = (
         select(Asset)
@@ -239,16 +329,13 @@ def list_assets_by_project(db: Session, project_id: str) -> list[Asset]:
 
 def get_latest_active_project_job(db: Session, project_id: str) -> Job | None:
     stmt = (
-        select(ProjectRun)
-        .where(ProjectRun.project_id == project_id)
+        select(Job)
+        .join(ProjectRun, ProjectRun.job_id == Job.id)
+        .where(
+            ProjectRun.project_id == project_id,
+            Job.status.in_([JobStatus.QUEUED, JobStatus.PROCESSING]),
+        )
         .order_by(ProjectRun.created_at.desc())
-        .limit(20)
+        .limit(1)
     )
-    rows = list(db.scalars(stmt))
-    for row in rows:
-        job = get_job(db, row.job_id)
-        if job is None:
-            continue
-        if job.status in {JobStatus.QUEUED, JobStatus.PROCESSING}:
-            return job
-    return None
+    return db.scalars(stmt).first()
@@ -1,7 +1,12 @@
-from typing import Generator
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy import CheckConstraint, Engine, create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, scoped_session, sessionmaker
+from sqlalchemy.schema import AddConstraint
 
 from app.config import settings
 
@@ -10,13 +15,171 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+def _pool_options(url: str) -> dict[str, int]:
+    # SQLite uses its own pool classes, which reject the QueuePool sizing arguments.
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # WAL lets readers run alongside the worker's frequent small commits; NORMAL skips the per-commit fsync.
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _tune_sqlite(engine: Engine) -> None:
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+
+
+def _connect_args(url: str) -> dict[str, object]:
+    # The threadpool hands pooled SQLite connections to different threads.
+    if make_url(url).drivername in {"sqlite", "sqlite+pysqlite"}:
+        return {"check_same_thread": False}
+    return {}
+
+
+engine = create_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    connect_args=_connect_args(settings.database_url),
+    **_pool_options(settings.database_url),
+)
+_tune_sqlite(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, class_=Session)
 
+# Keyed by request rather than thread: sync dependencies and routes may run on different
+# threadpool threads, but both inherit the context set by ScopedSessionMiddleware.
+_request_scope: ContextVar[object | None] = ContextVar("db_request_scope", default=None)
+ScopedSession = scoped_session(SessionLocal, scopefunc=_request_scope.get)
+# Celery tasks: thread-local session; remove() after each task hands its connection back to the
+# pool, which keeps it open (pre-pinged, recycled) for the next task on this worker.
+TaskSession = scoped_session(SessionLocal)
+
+
+def init_schema() -> None:
+    import app.models  # noqa: F401, PLC0415 - registers the tables on Base.metadata
+
+    Base.metadata.create_all(bind=engine)
+    convert_legacy_status_enums()
+    ensure_indexes()
+
+
+# Native Postgres ENUM types the status columns used before they became checked VARCHARs.
+_LEGACY_STATUS_ENUMS = {"jobs": "job_status", "projects": "project_status"}
+
+
+def convert_legacy_status_enums() -> None:
+    """Convert pre-existing ENUM status columns to the models' VARCHAR + CHECK; a no-op once done."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for table_name, enum_name in _LEGACY_STATUS_ENUMS.items():
+            udt_name = conn.execute(
+                text(
+                    "SELECT udt_name FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = :table AND column_name = 'status'"
+                ),
+                {"table": table_name},
+            ).scalar()
+            if udt_name != enum_name:
+                continue
+            # Partial-index predicates hold enum-typed literals and block the type change;
+            # ensure_indexes rebuilds the ones the models still declare.
+            index_names = conn.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = :table AND indexdef LIKE '%status%'"),
+                {"table": table_name},
+            ).scalars()
+            for index_name in list(index_names):
+                conn.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+            conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN status TYPE varchar(16) USING status::text"))
+            for constraint in Base.metadata.tables[table_name].constraints:
+                if isinstance(constraint, CheckConstraint):
+                    conn.execute(AddConstraint(constraint))
+            conn.execute(text(f"DROP TYPE IF EXISTS {enum_name}"))
+
+
+def ensure_indexes() -> None:
+    # create_all only builds indexes together with new tables; add any missing ones
+    # to tables that already exist (no migration tool in this project).
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+class ScopedSessionMiddleware:
+    """Gives each HTTP request one scoped Session and removes it once the response is sent."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(object())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            ScopedSession.remove()
+            _request_scope.reset(token)
+
 
 def get_db() -> Generator[Session, None, None]:
+    if _request_scope.get() is not None:
+        yield ScopedSession()
+        return
+    # Outside the middleware (scripts, direct calls) fall back to a private session.
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+_ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def _async_database_url() -> str:
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver known for database url: {url.drivername}")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # Built on first use so Celery workers (sync sessions only) never need the async driver.
+    url = _async_database_url()
+    async_engine = create_async_engine(url, pool_pre_ping=True, **_pool_options(url))
+    _tune_sqlite(async_engine.sync_engine)
+    return async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,11 @@
+# Creates missing tables and indexes; run once per deploy instead of in every API process.
+from app.db import init_schema
+
+
+def main() -> None:
+    init_schema()
+    print("database schema is up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,26 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes.health import router as health_router
 from app.api.routes.jobs import router as jobs_router
 from app.api.routes.projects import router as projects_router
 from app.config import settings
-from app.db import Base, engine
+from app.db import ScopedSessionMiddleware, init_schema
 
 
-def create_app() -> FastAPI:
-    app = FastAPI(title=settings.app_name)
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    if settings.db_create_schema_on_startup:
+        init_schema()
+    yield
 
-    @app.on_event("startup")
-    def on_startup() -> None:
-        Base.metadata.create_all(bind=engine)
+
+def create_app() -> FastAPI:
+    app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=ORJSONResponse)
+    app.add_middleware(ScopedSessionMiddleware)
 
     app.include_router(health_router, prefix="/api/v1")
     app.include_router(jobs_router, prefix="/api/v1")
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
 import enum
+import os
+import time
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db import Base
 
 
+def _uuid7() -> uuid.UUID:
+    # RFC 9562 UUIDv7 for Pythons without uuid.uuid7 (3.14+): 48-bit unix ms timestamp, then random bits.
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+_new_uuid = getattr(uuid, "uuid7", _uuid7)
+
+
+def _new_id() -> str:
+    # Time-ordered ids keep primary-key inserts appending to the right edge of the index.
+    return str(_new_uuid())
+
+
 class JobStatus(str, enum.Enum):
     QUEUED = "queued"
     PROCESSING = "processing"
@@ -24,15 +42,42 @@ class ProjectStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+def _status_column_type(enum_cls: type[enum.Enum]) -> Enum:
+    # Plain VARCHAR holding the member name (what the native ENUM stored), checked by a
+    # named CHECK constraint instead of a database ENUM type that needs ALTER TYPE to change.
+    return Enum(enum_cls, native_enum=False, create_constraint=False, length=16)
+
+
+def _status_in(enum_cls: type[enum.Enum], *members: enum.Enum) -> str:
+    names = ", ".join(f"'{member.name}'" for member in (members or tuple(enum_cls)))
+    return f"status IN ({names})"
+
+
+_ACTIVE_JOB_STATUSES = _status_in(JobStatus, JobStatus.QUEUED, JobStatus.PROCESSING)
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        CheckConstraint(_status_in(JobStatus), name="ck_jobs_status"),
+        Index("ix_jobs_created_at", "created_at"),
+        # Small index over in-flight jobs only, for the active-status lookups
+        # (get_latest_active_project_job); newest first within a status.
+        Index(
+            "ix_jobs_active_status_created",
+            "status",
+            "created_at",
+            postgresql_where=text(_ACTIVE_JOB_STATUSES),
+            sqlite_where=text(_ACTIVE_JOB_STATUSES),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=_new_id
     )
     job_type: Mapped[str] = mapped_column(String(50), nullable=False, default="test_render")
     status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus, name="job_status"),
+        _status_column_type(JobStatus),
         nullable=False,
         default=JobStatus.QUEUED,
     )
@@ -78,13 +123,17 @@ class JobRuntime(Base):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        CheckConstraint(_status_in(ProjectStatus), name="ck_projects_status"),
+        Index("ix_projects_created_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=_new_id
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     status: Mapped[ProjectStatus] = mapped_column(
-        Enum(ProjectStatus, name="project_status"),
+        _status_column_type(ProjectStatus),
         nullable=False,
         default=ProjectStatus.DRAFT,
     )
@@ -111,9 +160,13 @@ class Project(Base):
 
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        # Matches list_assets_by_project: project_id filter, (order_index, created_at) sort.
+        Index("ix_assets_project_id_order_index_created_at", "project_id", "order_index", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=_new_id
     )
     project_id: Mapped[str] = mapped_column(
         String(36),
@@ -134,9 +187,14 @@ class Asset(Base):
 
 class ProjectRun(Base):
     __tablename__ = "project_runs"
+    __table_args__ = (
+        # Backs the latest-run-per-project lookup (project_id filter, created_at sort).
+        Index("ix_project_runs_project_id_created_at", "project_id", "created_at"),
+        Index("ix_project_runs_job_id", "job_id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=_new_id
     )
     project_id: Mapped[str] = mapped_column(
         String(36),
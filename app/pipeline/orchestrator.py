@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 from app.canvas.pipeline import run_canvas_job
+from app.config import settings
 from app.video.last_clip import build_last_clip
 from app.video.render import build_final_render
 from app.video.transition import build_transition_clip
 
 
+_PROGRESS_MIN_INTERVAL_S = 0.5
+
+
 @dataclass(slots=True)
 class PipelineRunSummary:
     final_output_path: str
@@ -28,6 +36,56 @@ def _require_files(paths: list[str]) -> None:
             raise FileNotFoundError(f"input image not found: {p}")
 
 
+@lru_cache(maxsize=1)
+def _pipeline_executor(max_workers: int) -> ProcessPoolExecutor:
+    # Spawned (not forked) children so no CUDA/model state leaks across the boundary;
+    # the pool lives for the worker process so model loads are amortized across jobs.
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _canvas_item(input_path: str, output_path: str) -> tuple[bool, bool]:
+    # Only the flags cross the process boundary, not the full canvas image.
+    result = run_canvas_job(input_path, output_path)
+    return result.fallback_applied, result.safety_passed
+
+
+def _transition_item(**kwargs: Any) -> tuple[str, bool, bool]:
+    result = build_transition_clip(**kwargs)
+    return result.output_path, result.fallback_applied, result.safety_passed
+
+
+def _run_items(
+    fn: Callable[..., Any],
+    items: list[dict[str, Any]],
+    *,
+    check: Callable[[], None],
+    progress: Callable[[int], None],
+) -> list[Any]:
+    """Run independent items in order, or on the process pool when configured; results keep item order."""
+    workers = min(len(items), max(1, settings.pipeline_max_workers))
+    if workers <= 1:
+        results = []
+        for position, kwargs in enumerate(items, start=1):
+            check()
+            progress(position)
+            results.append(fn(**kwargs))
+        return results
+
+    check()
+    executor = _pipeline_executor(settings.pipeline_max_workers)
+    futures: dict[Future, int] = {executor.submit(fn, **kwargs): idx for idx, kwargs in enumerate(items)}
+    ordered: list[Any] = [None] * len(items)
+    try:
+        for done, future in enumerate(as_completed(futures), start=1):
+            ordered[futures[future]] = future.result()
+            progress(done)
+            check()
+    finally:
+        for future in futures:
+            future.cancel()
+    return ordered
+
+
 def run_full_pipeline(
     *,
     image_paths: list[str],
@@ -50,9 +108,21 @@ def run_full_pipeline(
 
     _require_files(image_paths)
 
+    last_stage: str | None = None
+    last_emit_at = 0.0
+
     def _emit(stage: str, progress: int, detail: str | None = None) -> None:
-        if on_progress is not None:
-            on_progress(stage, progress, detail)
+        nonlocal last_stage, last_emit_at
+        if on_progress is None:
+            return
+        # Stage transitions always go through; per-item updates within a stage are
+        # coalesced so fast loops do not turn into one runtime commit per item.
+        now = time.monotonic()
+        if stage == last_stage and now - last_emit_at < _PROGRESS_MIN_INTERVAL_S:
+            return
+        last_stage = stage
+        last_emit_at = now
+        on_progress(stage, progress, detail)
 
     def _check() -> None:
         if check_canceled is not None:
@@ -66,7 +136,6 @@ def run_full_pipeline(
     for d in (canvas_dir, transition_dir, last_dir, render_dir):
         d.mkdir(parents=True, exist_ok=True)
 
-    canvas_paths: list[str] = []
     transition_paths: list[str] = []
     fallback_count = 0
     canvas_fallback_count = 0
@@ -79,18 +148,25 @@ def run_full_pipeline(
     # 1) Normalize/extend each image to target canvas.
     total_images = len(image_paths)
     _emit("canvas_start", 5, f"canvas start: {total_images} image(s)")
-    for idx, img_path in enumerate(image_paths):
-        _check()
-        canvas_progress = 6 + int(((idx) / max(1, total_images)) * 33)
-        _emit("canvas", canvas_progress, f"canvas {idx + 1}/{total_images}")
-        out_path = canvas_dir / f"canvas_{idx:04d}.jpg"
-        canvas_result = run_canvas_job(img_path, str(out_path))
-        canvas_paths.append(str(out_path))
-
-        if canvas_result.fallback_applied:
+    canvas_paths = [str(canvas_dir / f"canvas_{idx:04d}.jpg") for idx in range(total_images)]
+    canvas_flags = _run_items(
+        _canvas_item,
+        [
+            {"input_path": img_path, "output_path": out_path}
+            for img_path, out_path in zip(image_paths, canvas_paths)
+        ],
+        check=_check,
+        progress=lambda position: _emit(
+            "canvas",
+            6 + int(((position - 1) / max(1, total_images)) * 33),
+            f"canvas {position}/{total_images}",
+        ),
+    )
+    for fallback_applied, safety_passed in canvas_flags:
+        if fallback_applied:
             fallback_count += 1
             canvas_fallback_count += 1
-        if not canvas_result.safety_passed:
+        if not safety_passed:
             safety_failed_count += 1
     _emit("canvas_done", 40, f"canvas done: {len(canvas_paths)} image(s)")
 
@@ -98,24 +174,32 @@ def run_full_pipeline(
     if len(canvas_paths) >= 2:
         total_transitions = len(canvas_paths) - 1
         _emit("transition_start", 45, f"transition start: {total_transitions} clip(s)")
-        for idx in range(total_transitions):
-            _check()
-            trans_progress = 46 + int(((idx) / max(1, total_transitions)) * 28)
-            _emit("transition", trans_progress, f"transition {idx + 1}/{total_transitions}")
-            out_clip = transition_dir / f"transition_{idx:04d}.mp4"
-            t_result = build_transition_clip(
-                image_a_path=canvas_paths[idx],
-                image_b_path=canvas_paths[idx + 1],
-                output_path=str(out_clip),
-                duration_seconds=transition_duration_seconds,
-                prompt=transition_prompt,
-                negative_prompt=transition_negative_prompt,
-            )
-            transition_paths.append(t_result.output_path)
-            if t_result.fallback_applied:
+        transition_results = _run_items(
+            _transition_item,
+            [
+                {
+                    "image_a_path": canvas_paths[idx],
+                    "image_b_path": canvas_paths[idx + 1],
+                    "output_path": str(transition_dir / f"transition_{idx:04d}.mp4"),
+                    "duration_seconds": transition_duration_seconds,
+                    "prompt": transition_prompt,
+                    "negative_prompt": transition_negative_prompt,
+                }
+                for idx in range(total_transitions)
+            ],
+            check=_check,
+            progress=lambda position: _emit(
+                "transition",
+                46 + int(((position - 1) / max(1, total_transitions)) * 28),
+                f"transition {position}/{total_transitions}",
+            ),
+        )
+        for output_path, fallback_applied, safety_passed in transition_results:
+            transition_paths.append(output_path)
+            if fallback_applied:
                 fallback_count += 1
                 transition_fallback_count += 1
-            if not t_result.safety_passed:
+            if not safety_passed:
                 safety_failed_count += 1
         _emit("transition_done", 75, f"transition done: {len(transition_paths)} clip(s)")
     else:
@@ -143,6 +227,7 @@ def run_full_pipeline(
         output_path=final_output_path,
         bgm_path=bgm_path,
         bgm_volume=bgm_volume,
+        skip_validate=True,
     )
     _emit("render_done", 99, "final render completed")
     _emit("completed", 100, "pipeline completed")
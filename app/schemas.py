@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from app.models import JobStatus
 
@@ -128,6 +128,10 @@ class JobResponse(BaseModel):
     cancel_requested: bool | None = None
 
 
+# Built once; list endpoints dump through it instead of FastAPI re-validating each item.
+JOB_RESPONSE_LIST_ADAPTER = TypeAdapter(list[JobResponse])
+
+
 class JobCancelResponse(BaseModel):
     job_id: str
     status: JobStatus
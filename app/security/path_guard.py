@@ -1,31 +1,23 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from app.config import settings
 
 
-def _allowed_roots() -> list[Path]:
+@lru_cache(maxsize=1)
+def _allowed_roots() -> tuple[str, ...]:
+    # Resolved once per process; each entry ends with a separator so a plain prefix
+    # test cannot match a sibling directory such as "data2" for "data".
     roots = [Path("data").resolve(), Path(settings.storage_root).resolve()]
-    unique: list[Path] = []
-    seen: set[str] = set()
-    for root in roots:
-        key = str(root)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(root)
-    return unique
-
-
-def _is_under_any_root(path: Path, roots: list[Path]) -> bool:
-    for root in roots:
-        try:
-            path.relative_to(root)
-            return True
-        except ValueError:
-            continue
-    return False
+    prefixes = (os.path.normcase(str(root)).rstrip(os.sep) + os.sep for root in roots)
+    return tuple(dict.fromkeys(prefixes))
+
+
+def _is_under_any_root(path: Path, roots: tuple[str, ...]) -> bool:
+    return (os.path.normcase(str(path)) + os.sep).startswith(roots)
 
 
 def ensure_safe_input_path(path_str: str) -> str:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+import shutil
+import string
 import uuid
 from pathlib import Path
 
@@ -11,10 +13,15 @@ from app.config import settings
 
 
 _SAFE_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9._-]+")
+_SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+_COPY_CHUNK_SIZE = 64 * 1024
+_JPEG_SAVE_OPTIONS = {"quality": 85, "optimize": True, "progressive": True, "subsampling": "4:2:0"}
 
 
 def _safe_name(name: str) -> str:
-    cleaned = _SAFE_NAME_PATTERN.sub("_", name).strip("._")
+    # Camera-style names are usually already clean; skip the regex for them.
+    cleaned = name if _SAFE_NAME_CHARS.issuperset(name) else _SAFE_NAME_PATTERN.sub("_", name)
+    cleaned = cleaned.strip("._")
     return cleaned or "upload.jpg"
 
 
@@ -28,12 +35,26 @@ def save_project_asset_file(project_id: str, upload: UploadFile) -> tuple[str, i
     new_name = f"{uuid.uuid4().hex}{ext.lower()}"
     destination = root / new_name
 
-    data = upload.file.read()
-    destination.write_bytes(data)
+    # Stream in fixed chunks so memory stays flat regardless of upload size.
+    with open(destination, "wb") as dst:
+        shutil.copyfileobj(upload.file, dst, length=_COPY_CHUNK_SIZE)
 
+    # Re-encode only when the pipeline could not read the file as-is: non-RGB modes or
+    # content whose format does not match the stored extension.
+    # Opening only parses the header, so the size is known without decoding any pixels.
+    save_format = Image.registered_extensions().get(ext.lower())
     with Image.open(destination) as img:
-        rgb = img.convert("RGB")
-        width, height = rgb.size
-        rgb.save(destination)
+        width, height = img.size
+        needs_rewrite = img.mode != "RGB" or img.format != save_format
+        img.verify()
+
+    if needs_rewrite:
+        with Image.open(destination) as img:
+            # Lets libjpeg emit RGB directly for grayscale/CMYK JPEGs; a no-op for other formats.
+            img.draft("RGB", img.size)
+            rgb = img.convert("RGB")
+        # Explicit JPEG settings instead of Pillow's quality=75 default.
+        options = _JPEG_SAVE_OPTIONS if save_format == "JPEG" else {}
+        rgb.save(destination, **options)
 
     return str(destination), width, height, safe_name
@@ -1,6 +1,9 @@
 import json
 import logging
+import queue
 import subprocess
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib import error as urllib_error
@@ -13,7 +16,7 @@ from app import crud
 from app.canvas.pipeline import run_canvas_job
 from app.celery_app import celery_app
 from app.config import settings
-from app.db import SessionLocal
+from app.db import SessionLocal, TaskSession
 from app.models import JobStatus, ProjectStatus
 from app.pipeline.orchestrator import run_full_pipeline
 from app.video.last_clip import build_last_clip
@@ -27,6 +30,54 @@ class JobCanceledError(RuntimeError):
     pass
 
 
+_PROGRESS_MIN_STEP = 10
+_PROGRESS_MIN_INTERVAL_S = 1.0
+_CANCEL_CHECK_INTERVAL_S = 0.2
+
+
+class _ProgressThrottle(threading.local):
+    """Last progress write of the job running on this worker thread (one task at a time per thread)."""
+
+    job_id: str | None = None
+    stage: str | None = None
+    progress: int = 0
+    written_at: float = 0.0
+
+    def should_write(self, job_id: str, stage: str, progress: int) -> bool:
+        now = time.monotonic()
+        if (
+            job_id == self.job_id
+            and stage == self.stage
+            and progress not in (0, 100)
+            and progress - self.progress < _PROGRESS_MIN_STEP
+            and now - self.written_at < _PROGRESS_MIN_INTERVAL_S
+        ):
+            return False
+        self.job_id, self.stage, self.progress, self.written_at = job_id, stage, progress, now
+        return True
+
+
+_progress_throttle = _ProgressThrottle()
+
+
+class _CancelCache(threading.local):
+    """Cancel flag of the job running on this worker thread; False is re-read at most every 200 ms."""
+
+    job_id: str | None = None
+    requested: bool = False
+    checked_at: float = 0.0
+
+    def is_requested(self, db: Session, job_id: str) -> bool:
+        now = time.monotonic()
+        if job_id == self.job_id and (self.requested or now - self.checked_at < _CANCEL_CHECK_INTERVAL_S):
+            return self.requested
+        self.job_id, self.requested, self.checked_at = job_id, crud.is_cancel_requested(db, job_id), now
+        return self.requested
+
+
+_cancel_cache = _CancelCache()
+
+
 def _update_progress(
     db: Session,
     job_id: str,
@@ -35,6 +86,9 @@ def _update_progress(
     progress: int,
     detail: str | None = None,
 ) -> None:
+    # Stage changes and 0/100 always land; same-stage updates need a 10-point or 1 s gap.
+    if not _progress_throttle.should_write(job_id, stage, progress):
+        return
     crud.upsert_job_runtime(
         db,
         job_id,
@@ -44,8 +98,58 @@ def _update_progress(
     )
 
 
+class _ProgressWriter:
+    """Writes progress from a background thread (own session) so the pipeline never waits on the DB."""
+
+    _STOP = object()
+
+    def __init__(self, job_id: str) -> None:
+        self._job_id = job_id
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"progress-{job_id}", daemon=True)
+        self._thread.start()
+
+    def put(self, stage: str, progress: int, detail: str | None) -> None:
+        self._queue.put((stage, progress, detail))
+
+    def close(self) -> None:
+        # Idempotent; once it returns, no queued update can land after the caller's next write.
+        # No join timeout: returning early would let a pending write overwrite the final status.
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        db = SessionLocal()
+        try:
+            stop = False
+            while not stop:
+                pending = [self._queue.get()]
+                while True:
+                    try:
+                        pending.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                updates = []
+                for item in pending:
+                    if item is self._STOP:
+                        stop = True
+                    elif updates and updates[-1][0] == item[0]:
+                        updates[-1] = item  # a burst within one stage only needs its latest value
+                    else:
+                        updates.append(item)
+                for stage, progress, detail in updates:
+                    try:
+                        _update_progress(db, self._job_id, stage=stage, progress=progress, detail=detail)
+                    except Exception:  # noqa: BLE001 - progress is best effort
+                        db.rollback()
+                        logger.exception("progress update failed for job %s", self._job_id)
+        finally:
+            db.close()
+
+
 def _ensure_not_canceled(db: Session, job_id: str) -> None:
-    if crud.is_cancel_requested(db, job_id):
+    if _cancel_cache.is_requested(db, job_id):
         crud.mark_job_canceled(db, job_id, reason="canceled by user")
         raise JobCanceledError("canceled by user")
 
@@ -76,7 +180,7 @@ def _send_callback(callback_uri: str, payload: dict[str, object]) -> tuple[bool,
 
 @celery_app.task(name="app.tasks.run_test_render")
 def run_test_render(job_id: str) -> dict[str, str]:
-    db = SessionLocal()
+    db = TaskSession()
     try:
         _begin_processing(db, job_id)
         _update_progress(db, job_id, stage="test_start", progress=5, detail="checking ffmpeg")
@@ -104,7 +208,7 @@ def run_test_render(job_id: str) -> dict[str, str]:
         crud.set_job_status(db, job_id, JobStatus.FAILED, error_message=str(exc))
         raise
     finally:
-        db.close()
+        TaskSession.remove()
 
 
 @celery_app.task(name="app.tasks.run_canvas_render")
@@ -117,7 +221,7 @@ def run_canvas_render(
     outpaint_prompt: str | None = None,
     outpaint_negative_prompt: str | None = None,
 ) -> dict[str, str]:
-    db = SessionLocal()
+    db = TaskSession()
     try:
         _begin_processing(db, job_id)
         _update_progress(db, job_id, stage="canvas_start", progress=5, detail="starting canvas")
@@ -161,7 +265,7 @@ def run_canvas_render(
         crud.set_job_status(db, job_id, JobStatus.FAILED, error_message=str(exc))
         raise
     finally:
-        db.close()
+        TaskSession.remove()
 
 
 @celery_app.task(name="app.tasks.run_transition_render")
@@ -174,7 +278,7 @@ def run_transition_render(
     prompt: str,
     negative_prompt: str | None = None,
 ) -> dict[str, str]:
-    db = SessionLocal()
+    db = TaskSession()
     try:
         _begin_processing(db, job_id)
         _update_progress(db, job_id, stage="transition_start", progress=5, detail="starting transition")
@@ -212,7 +316,7 @@ def run_transition_render(
         crud.set_job_status(db, job_id, JobStatus.FAILED, error_message=str(exc))
         raise
     finally:
-        db.close()
+        TaskSession.remove()
 
 
 @celery_app.task(name="app.tasks.run_last_clip_render")
@@ -223,7 +327,7 @@ def run_last_clip_render(
     duration_seconds: int,
     motion_style: str,
 ) -> dict[str, str]:
-    db = SessionLocal()
+    db = TaskSession()
     try:
         _begin_processing(db, job_id)
         _update_progress(db, job_id, stage="last_clip_start", progress=5, detail="starting last clip")
@@ -255,7 +359,7 @@ def run_last_clip_render(
         crud.set_job_status(db, job_id, JobStatus.FAILED, error_message=str(exc))
         raise
     finally:
-        db.close()
+        TaskSession.remove()
 
 
 @celery_app.task(name="app.tasks.run_final_render")
@@ -267,7 +371,7 @@ def run_final_render(
     bgm_volume: float = 0.15,
     callback_uri: str | None = None,
 ) -> dict[str, str]:
-    db = SessionLocal()
+    db = TaskSession()
     try:
         _begin_processing(db, job_id)
         _update_progress(db, job_id, stage="render_start", progress=5, detail="starting final render")
@@ -279,6 +383,7 @@ def run_final_render(
             output_path=output_path,
             bgm_path=bgm_path,
             bgm_volume=bgm_volume,
+            skip_validate=True,
         )
         _update_progress(db, job_id, stage="render_finalize", progress=90, detail="finalizing output")
         _ensure_not_canceled(db, job_id)
@@ -315,7 +420,7 @@ def run_final_render(
         crud.set_job_status(db, job_id, JobStatus.FAILED, error_message=str(exc))
         raise
     finally:
-        db.close()
+        TaskSession.remove()
 
 
 @celery_app.task(name="app.tasks.run_pipeline_render")
@@ -333,32 +438,38 @@ def run_pipeline_render(
     bgm_volume: float,
     project_id: str | None = None,
 ) -> dict[str, str]:
-    db = SessionLocal()
+    db = TaskSession()
     try:
         _begin_processing(db, job_id)
         _update_progress(db, job_id, stage="pipeline_start", progress=1, detail="pipeline started")
         _ensure_not_canceled(db, job_id)
 
-        def on_progress(stage: str, progress: int, detail: str | None) -> None:
-            _update_progress(db, job_id, stage=stage, progress=progress, detail=detail)
+        progress_writer = _ProgressWriter(job_id)
 
         def check_canceled() -> None:
-            _ensure_not_canceled(db, job_id)
-
-        summary = run_full_pipeline(
-            image_paths=image_paths,
-            working_dir=working_dir,
-            final_output_path=final_output_path,
-            transition_duration_seconds=transition_duration_seconds,
-            transition_prompt=transition_prompt,
-            transition_negative_prompt=transition_negative_prompt,
-            last_clip_duration_seconds=last_clip_duration_seconds,
-            last_clip_motion_style=last_clip_motion_style,
-            bgm_path=bgm_path,
-            bgm_volume=bgm_volume,
-            on_progress=on_progress,
-            check_canceled=check_canceled,
-        )
+            if _cancel_cache.is_requested(db, job_id):
+                # Drain queued progress first so it cannot overwrite the canceled stage.
+                progress_writer.close()
+                crud.mark_job_canceled(db, job_id, reason="canceled by user")
+                raise JobCanceledError("canceled by user")
+
+        try:
+            summary = run_full_pipeline(
+                image_paths=image_paths,
+                working_dir=working_dir,
+                final_output_path=final_output_path,
+                transition_duration_seconds=transition_duration_seconds,
+                transition_prompt=transition_prompt,
+                transition_negative_prompt=transition_negative_prompt,
+                last_clip_duration_seconds=last_clip_duration_seconds,
+                last_clip_motion_style=last_clip_motion_style,
+                bgm_path=bgm_path,
+                bgm_volume=bgm_volume,
+                on_progress=progress_writer.put,
+                check_canceled=check_canceled,
+            )
+        finally:
+            progress_writer.close()
 
         message = (
             f"pipeline done: images={len(image_paths)}, "
@@ -389,4 +500,4 @@ def run_pipeline_render(
                 pass
         raise
     finally:
-        db.close()
+        TaskSession.remove()
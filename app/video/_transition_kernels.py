@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from app._numba_support import NUMBA_AVAILABLE, jit, prange  # noqa: F401 - NUMBA_AVAILABLE is checked by transition.py
+
+_COLUMN_BLOCK = 64
+
+
+def gaussian_box_radii(sigma: float, passes: int = 3) -> np.ndarray:
+    """Box radii whose repeated box blurs approximate a Gaussian of the given sigma."""
+    ideal = math.sqrt(12.0 * sigma * sigma / passes + 1.0)
+    lower = int(ideal)
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    m = round((12.0 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes) / (-4 * lower - 4))
+    widths = [lower if i < m else upper for i in range(passes)]
+    return np.array([max(0, (w - 1) // 2) for w in widths], dtype=np.int64)
+
+
+@jit(parallel=True, cache=True)
+def _box_rows(src: np.ndarray, dst: np.ndarray, r: int, inv: int) -> None:
+    # Sliding-window sum per row with clamped edges: O(1) per pixel whatever the radius.
+    # Division by the window width is a multiply by inv = 2**24 / width.
+    h, w, ch = src.shape
+    for y in prange(h):
+        for c in range(ch):
+            acc = np.int64(0)
+            for i in range(-r, r + 1):
+                acc += src[y, min(max(i, 0), w - 1), c]
+            for x in range(w):
+                dst[y, x, c] = (acc * inv + (1 << 23)) >> 24
+                acc += np.int64(src[y, min(x + r + 1, w - 1), c]) - np.int64(src[y, max(x - r, 0), c])
+
+
+@jit(parallel=True, cache=True)
+def _box_cols(src: np.ndarray, dst: np.ndarray, r: int, inv: int) -> None:
+    # Column blocks run in parallel; within a block rows are walked in order so reads stay row-major.
+    h, w, ch = src.shape
+    n_blocks = (w + _COLUMN_BLOCK - 1) // _COLUMN_BLOCK
+    for b in prange(n_blocks):
+        x0 = b * _COLUMN_BLOCK
+        x1 = min(x0 + _COLUMN_BLOCK, w)
+        acc = np.zeros((x1 - x0) * ch, dtype=np.int64)
+        for i in range(-r, r + 1):
+            row = src[min(max(i, 0), h - 1)].reshape(-1)
+            for k in range(x1 * ch - x0 * ch):
+                acc[k] += row[x0 * ch + k]
+        for y in range(h):
+            add = src[min(y + r + 1, h - 1)].reshape(-1)
+            sub = src[max(y - r, 0)].reshape(-1)
+            out = dst[y].reshape(-1)
+            for k in range(x1 * ch - x0 * ch):
+                j = x0 * ch + k
+                out[j] = (acc[k] * inv + (1 << 23)) >> 24
+                acc[k] += np.int64(add[j]) - np.int64(sub[j])
+
+
+@jit(parallel=True, cache=True)
+def _paste_bgr(bg_rgb: np.ndarray, fg_rgb: np.ndarray, x0: int, y0: int) -> np.ndarray:
+    h, w = bg_rgb.shape[:2]
+    fh, fw = fg_rgb.shape[:2]
+    out = np.empty((h, w, 3), dtype=np.uint8)
+    for y in prange(h):
+        fy = y - y0
+        for x in range(w):
+            fx = x - x0
+            if 0 <= fy < fh and 0 <= fx < fw:
+                for c in range(3):
+                    out[y, x, c] = fg_rgb[fy, fx, 2 - c]
+            else:
+                for c in range(3):
+                    out[y, x, c] = bg_rgb[y, x, 2 - c]
+    return out
+
+
+def blur_composite_bgr(
+    bg_rgb: np.ndarray,
+    fg_rgb: np.ndarray,
+    x0: int,
+    y0: int,
+    radii: np.ndarray,
+) -> np.ndarray:
+    """Box-blur bg (one row and one column pass per radius), paste fg at (x0, y0), return contiguous BGR."""
+    a = np.array(bg_rgb, dtype=np.uint8, order="C")
+    b = np.empty_like(a)
+    for r in radii:
+        inv = round((1 << 24) / (2 * int(r) + 1))
+        _box_rows(a, b, int(r), inv)
+        _box_cols(b, a, int(r), inv)
+    return _paste_bgr(a, np.ascontiguousarray(fg_rgb, dtype=np.uint8), int(x0), int(y0))
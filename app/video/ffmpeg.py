@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import contextlib
+import shutil
+import subprocess
+import threading
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+
+from app.config import settings
+
+_STDERR_TAIL_LINES = 200
+_STDIN_BUFFER_SIZE = 1 << 20
+
+# Hardware encoder per family, keyed by the CPU encoder it stands in for (same codec, so
+# stream-copy concat still sees matching clips).
+_HW_ENCODERS = {
+    "nvenc": {"libx264": "h264_nvenc", "libx265": "hevc_nvenc"},
+    "videotoolbox": {"libx264": "h264_videotoolbox", "libx265": "hevc_videotoolbox"},
+}
+_HW_ENCODER_ARGS = {
+    "nvenc": ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-b:v", "6M"],
+    "videotoolbox": ["-b:v", "6M"],
+}
+_HW_PROBE_TIMEOUT_S = 15
+
+
+@lru_cache(maxsize=8)
+def resolve_executable(name: str) -> str:
+    """Absolute path of name, looked up on PATH once per process instead of on every spawn."""
+    return shutil.which(name) or name
+
+
+def _drain(stream, tail: deque[bytes]) -> None:
+    for line in stream:
+        tail.append(line)
+
+
+@lru_cache(maxsize=4)
+def detect_hw_encoder(ffmpeg_path: str) -> str | None:
+    """First hardware encoder family that ffmpeg was built with and can actually open."""
+    try:
+        listing = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"], capture_output=True, text=True, check=False
+        ).stdout
+    except OSError:
+        return None
+    for family, encoders in _HW_ENCODERS.items():
+        encoder = encoders["libx264"]
+        if f" {encoder} " not in listing:
+            continue
+        # Static builds list nvenc even without a GPU or driver, so confirm with a one-frame encode.
+        cmd = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "color=size=256x256:rate=1:duration=1",
+            "-frames:v",
+            "1",
+            "-c:v",
+            encoder,
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            process = subprocess.run(cmd, capture_output=True, check=False, timeout=_HW_PROBE_TIMEOUT_S)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if process.returncode == 0:
+            return family
+    return None
+
+
+def video_encoder_args() -> list[str]:
+    """-c:v arguments for output_video_codec, swapped for a hardware encoder per hw_encoder."""
+    codec = settings.output_video_codec
+    family = settings.hw_encoder
+    if family == "auto":
+        family = detect_hw_encoder(settings.ffmpeg_path)
+    encoder = _HW_ENCODERS.get(family or "", {}).get(codec)
+    if encoder is None:
+        return ["-c:v", codec]
+    return ["-c:v", encoder, *_HW_ENCODER_ARGS[family]]
+
+
+def run_ffmpeg(cmd: list[str], error_message: str, *, stdin_chunks: Iterable[object] | None = None) -> None:
+    """Run ffmpeg, raising RuntimeError with the tail of its stderr on failure.
+
+    stderr is streamed into a bounded deque instead of being captured whole, since ffmpeg's
+    per-frame progress output on a long render is large and only needed when it fails.
+    stdin_chunks (bytes or any C-contiguous buffer, e.g. frame arrays) are piped to stdin.
+    """
+    tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
+    # No preexec_fn/start_new_session/cwd keeps CPython on its vfork spawn path, so a worker
+    # holding large models does not copy its page tables for every ffmpeg call.
+    process = subprocess.Popen(
+        [resolve_executable(cmd[0]), *cmd[1:]],
+        stdin=subprocess.DEVNULL if stdin_chunks is None else subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=_STDIN_BUFFER_SIZE,
+    )
+    reader = threading.Thread(target=_drain, args=(process.stderr, tail), daemon=True)
+    reader.start()
+    try:
+        if stdin_chunks is not None:
+            try:
+                for chunk in stdin_chunks:
+                    process.stdin.write(chunk)
+                process.stdin.close()
+            except BrokenPipeError:
+                # ffmpeg exited early; its stderr says why. Closing flushes, which can hit the same pipe.
+                with contextlib.suppress(BrokenPipeError):
+                    process.stdin.close()
+        returncode = process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        reader.join()
+        process.stderr.close()
+    if returncode != 0:
+        message = b"".join(tail).decode("utf-8", errors="replace").strip()
+        raise RuntimeError(message or error_message)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from app.config import settings
+from app.video.ffmpeg import run_ffmpeg, video_encoder_args
 
 
+@lru_cache(maxsize=4)
 def _motion_filter_expr(motion_style: str) -> str:
     if motion_style == "zoom_out":
         return (
@@ -26,6 +28,17 @@ def _motion_filter_expr(motion_style: str) -> str:
     )
 
 
+@lru_cache(maxsize=4)
+def _last_clip_vf(motion_style: str) -> str:
+    # Output settings are fixed for the process lifetime, so each style's graph is built once.
+    base_norm = (
+        f"scale={settings.target_width}:{settings.target_height}:force_original_aspect_ratio=decrease,"
+        f"pad={settings.target_width}:{settings.target_height}:(ow-iw)/2:(oh-ih)/2"
+    )
+    motion = _motion_filter_expr(motion_style)
+    return f"{base_norm},{motion},format={settings.output_pixel_format}"
+
+
 def build_last_clip(
     image_path: str,
     output_path: str,
@@ -36,12 +49,7 @@ def build_last_clip(
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    base_norm = (
-        f"scale={settings.target_width}:{settings.target_height}:force_original_aspect_ratio=decrease,"
-        f"pad={settings.target_width}:{settings.target_height}:(ow-iw)/2:(oh-ih)/2"
-    )
-    motion = _motion_filter_expr(motion_style)
-    vf = f"{base_norm},{motion},format={settings.output_pixel_format}"
+    vf = _last_clip_vf(motion_style)
 
     cmd = [
         settings.ffmpeg_path,
@@ -60,11 +68,8 @@ def build_last_clip(
         str(settings.target_fps),
         "-pix_fmt",
         settings.output_pixel_format,
-        "-c:v",
-        settings.output_video_codec,
+        *video_encoder_args(),
         str(out),
     ]
-    process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if process.returncode != 0:
-        raise RuntimeError(process.stderr.strip() or "ffmpeg last-clip build failed")
+    run_ffmpeg(cmd, "ffmpeg last-clip build failed")
     return str(out)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.config import settings
+from app.video.ffmpeg import resolve_executable
+
+
+@dataclass(frozen=True, slots=True)
+class StreamInfo:
+    codec: str
+    profile: str
+    width: int
+    height: int
+    frame_rate: str
+    pix_fmt: str
+    sample_aspect_ratio: str
+
+
+def _ffprobe_path() -> str:
+    # ffprobe ships next to ffmpeg (e.g. ./bin/ffmpeg -> ./bin/ffprobe).
+    head, name = os.path.split(settings.ffmpeg_path)
+    return os.path.join(head, name.replace("ffmpeg", "ffprobe", 1))
+
+
+@lru_cache(maxsize=1024)
+def probe(path: str, mtime_ns: int, size: int) -> StreamInfo | None:
+    """First video stream of path, or None when ffprobe is unavailable or finds none.
+
+    mtime_ns/size are part of the cache key, so a file rewritten in place is probed again
+    and stale entries simply age out of the LRU.
+    """
+    cmd = [
+        resolve_executable(_ffprobe_path()),
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=codec_name,profile,width,height,r_frame_rate,pix_fmt,sample_aspect_ratio",
+        "-of",
+        "json",
+        path,
+    ]
+    try:
+        process = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    if process.returncode != 0:
+        return None
+    streams = json.loads(process.stdout or "{}").get("streams") or []
+    if not streams:
+        return None
+    s = streams[0]
+    return StreamInfo(
+        codec=s.get("codec_name", ""),
+        profile=s.get("profile", ""),
+        width=int(s.get("width", 0)),
+        height=int(s.get("height", 0)),
+        frame_rate=s.get("r_frame_rate", ""),
+        pix_fmt=s.get("pix_fmt", ""),
+        sample_aspect_ratio=s.get("sample_aspect_ratio", "1:1"),
+    )
+
+
+def probe_file(path: str) -> StreamInfo | None:
+    st = os.stat(path)
+    return probe(path, st.st_mtime_ns, st.st_size)
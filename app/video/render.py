@@ -1,51 +1,99 @@
 from __future__ import annotations
 
-import subprocess
+import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from app.config import settings
+from app.video.ffmpeg import run_ffmpeg, video_encoder_args
+from app.video.probe import probe_file
+
+
+# Encoder -> codec_name reported by ffprobe, for deciding whether clips can be stream-copied.
+_ENCODER_CODECS = {
+    "libx264": "h264",
+    "h264_nvenc": "h264",
+    "libx265": "hevc",
+    "hevc_nvenc": "hevc",
+    "libvpx-vp9": "vp9",
+}
 
 
 def _validate_inputs(clip_paths: list[str]) -> None:
     if not clip_paths:
         raise ValueError("clip_paths must not be empty")
     for clip in clip_paths:
-        p = Path(clip)
-        if not p.exists():
+        if not os.path.exists(clip):
             raise FileNotFoundError(f"clip not found: {clip}")
 
 
-def _run_ffmpeg(cmd: list[str], error_message: str) -> None:
-    process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if process.returncode != 0:
-        raise RuntimeError(process.stderr.strip() or error_message)
-
-
-def _normalize_clip(input_path: str, output_path: str) -> None:
-    """Normalize clip codec/size/fps before concat to avoid stream mismatch issues."""
-    vf = (
+@lru_cache(maxsize=1)
+def _normalize_vf() -> str:
+    return (
         f"scale={settings.target_width}:{settings.target_height}:force_original_aspect_ratio=decrease,"
         f"pad={settings.target_width}:{settings.target_height}:(ow-iw)/2:(oh-ih)/2:black,"
         f"fps={settings.target_fps},setsar=1,format={settings.output_pixel_format}"
     )
-    cmd = [
-        settings.ffmpeg_path,
-        "-y",
-        "-i",
-        str(Path(input_path).resolve()),
-        "-vf",
-        vf,
-        "-an",
-        "-r",
-        str(settings.target_fps),
-        "-pix_fmt",
+
+
+def _clips_match_output(clip_paths: list[str]) -> bool:
+    """True when every clip already has the output codec/size/fps/pix_fmt, so concat can stream-copy."""
+    codec = _ENCODER_CODECS.get(settings.output_video_codec)
+    if codec is None:
+        return False
+    expected = (
+        codec,
+        settings.target_width,
+        settings.target_height,
+        f"{settings.target_fps}/1",
         settings.output_pixel_format,
-        "-c:v",
-        settings.output_video_codec,
-        str(Path(output_path).resolve()),
+    )
+    profiles: set[str] = set()
+    for clip in clip_paths:
+        info = probe_file(clip)
+        if info is None:
+            return False
+        actual = (info.codec, info.width, info.height, info.frame_rate, info.pix_fmt)
+        if actual != expected or info.sample_aspect_ratio not in ("1:1", "0:1", "N/A"):
+            return False
+        profiles.add(info.profile)
+    return len(profiles) == 1
+
+
+def _bgm_args(bgm_path: str | None, bgm_volume: float, input_index: int) -> tuple[list[str], list[str]]:
+    """(input args, output args) that mix a looped BGM track in, or drop audio when there is none."""
+    if not bgm_path:
+        return [], ["-an"]
+    bgm = Path(bgm_path)
+    if not bgm.exists():
+        raise FileNotFoundError(f"bgm not found: {bgm_path}")
+    input_args = ["-stream_loop", "-1", "-i", os.path.abspath(bgm_path)]
+    output_args = [
+        "-map",
+        f"{input_index}:a:0",
+        "-filter:a",
+        f"volume={bgm_volume}",
+        "-shortest",
+        "-c:a",
+        "aac",
     ]
-    _run_ffmpeg(cmd, "ffmpeg normalize clip failed")
+    return input_args, output_args
+
+
+def _concat_list_entry(path: str) -> str:
+    # Concat-demuxer syntax: single-quoted, with embedded quotes written as '\''.
+    escaped = path.replace(os.sep, "/").replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+def _concat_filter_graph(clip_count: int) -> str:
+    # Every input is normalized inside the same graph, so each clip is decoded and encoded once.
+    vf = _normalize_vf()
+    parts = [f"[{idx}:v]{vf}[v{idx}]" for idx in range(clip_count)]
+    labels = "".join(f"[v{idx}]" for idx in range(clip_count))
+    parts.append(f"{labels}concat=n={clip_count}:v=1:a=0[outv]")
+    return ";".join(parts)
 
 
 def build_final_render(
@@ -54,58 +102,28 @@ def build_final_render(
     *,
     bgm_path: str | None = None,
     bgm_volume: float = 0.15,
+    skip_validate: bool = False,
 ) -> str:
-    _validate_inputs(clip_paths)
+    # Callers that just produced the clips, or checked them with ensure_safe_input_path,
+    # can skip the per-clip existence check.
+    if skip_validate:
+        if not clip_paths:
+            raise ValueError("clip_paths must not be empty")
+    else:
+        _validate_inputs(clip_paths)
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
+    # Absolute (not symlink-resolved) paths: the concat list is read relative to its own
+    # directory, and abspath needs no per-component filesystem walk.
+    clip_paths = [os.path.abspath(clip) for clip in clip_paths]
 
-    with tempfile.TemporaryDirectory(prefix="render_concat_") as tmp_dir:
-        normalized_paths: list[Path] = []
-        for idx, clip in enumerate(clip_paths):
-            normalized = Path(tmp_dir) / f"norm_{idx:04d}.mp4"
-            _normalize_clip(clip, str(normalized))
-            normalized_paths.append(normalized)
-
-        list_file = Path(tmp_dir) / "clips.txt"
-        with list_file.open("w", encoding="utf-8") as fp:
-            for clip in normalized_paths:
-                fp.write(f"file '{clip.resolve().as_posix()}'\n")
-
-        if bgm_path:
-            bgm = Path(bgm_path)
-            if not bgm.exists():
-                raise FileNotFoundError(f"bgm not found: {bgm_path}")
-            cmd = [
-                settings.ffmpeg_path,
-                "-y",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                str(list_file),
-                "-stream_loop",
-                "-1",
-                "-i",
-                str(bgm.resolve()),
-                "-map",
-                "0:v:0",
-                "-map",
-                "1:a:0",
-                "-filter:a",
-                f"volume={bgm_volume}",
-                "-shortest",
-                "-r",
-                str(settings.target_fps),
-                "-pix_fmt",
-                settings.output_pixel_format,
-                "-c:v",
-                settings.output_video_codec,
-                "-c:a",
-                "aac",
-                str(out),
-            ]
-        else:
+    if _clips_match_output(clip_paths):
+        # Clips produced by this pipeline usually already match; then the concat only
+        # rewrites container headers instead of decoding and re-encoding every frame.
+        bgm_inputs, audio_args = _bgm_args(bgm_path, bgm_volume, 1)
+        with tempfile.TemporaryDirectory(prefix="render_concat_") as tmp_dir:
+            list_file = Path(tmp_dir) / "clips.txt"
+            list_file.write_text("".join(map(_concat_list_entry, clip_paths)), encoding="utf-8")
             cmd = [
                 settings.ffmpeg_path,
                 "-y",
@@ -115,18 +133,37 @@ def build_final_render(
                 "0",
                 "-i",
                 str(list_file),
+                *bgm_inputs,
                 "-map",
                 "0:v:0",
-                "-an",
-                "-r",
-                str(settings.target_fps),
-                "-pix_fmt",
-                settings.output_pixel_format,
+                *audio_args,
                 "-c:v",
-                settings.output_video_codec,
+                "copy",
                 str(out),
             ]
+            run_ffmpeg(cmd, "ffmpeg final render failed")
+        return str(out)
 
-        _run_ffmpeg(cmd, "ffmpeg final render failed")
-
+    bgm_inputs, audio_args = _bgm_args(bgm_path, bgm_volume, len(clip_paths))
+    clip_inputs: list[str] = []
+    for clip in clip_paths:
+        clip_inputs += ["-i", clip]
+    cmd = [
+        settings.ffmpeg_path,
+        "-y",
+        *clip_inputs,
+        *bgm_inputs,
+        "-filter_complex",
+        _concat_filter_graph(len(clip_paths)),
+        "-map",
+        "[outv]",
+        *audio_args,
+        "-r",
+        str(settings.target_fps),
+        "-pix_fmt",
+        settings.output_pixel_format,
+        *video_encoder_args(),
+        str(out),
+    ]
+    run_ffmpeg(cmd, "ffmpeg final render failed")
     return str(out)
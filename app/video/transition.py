@@ -1,20 +1,42 @@
 from __future__ import annotations
 
-import subprocess
-import tempfile
+import logging
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Protocol
 
 import numpy as np
 from PIL import Image, ImageFilter
 
+from app.canvas.color import bgr_to_pil, pil_to_bgr
 from app.canvas.detector import AnimalDetector, create_default_detector
 from app.canvas.safety import check_protected_region_unchanged
 from app.config import settings
+from app.video.ffmpeg import run_ffmpeg, video_encoder_args
+
+logger = logging.getLogger(__name__)
 
 ALLOWED_TRANSITION_DURATIONS = {6, 10}
+_TRT_ENGINE_CACHE_DIR = Path.home() / ".cache" / "memorialtube" / "trt"
+_LCM_MAX_STEPS = 8
+_BACKGROUND_BLUR_RADIUS = 22
+_RESAMPLE_FILTERS = {
+    "lanczos": Image.Resampling.LANCZOS,
+    "bicubic": Image.Resampling.BICUBIC,
+    "bilinear": Image.Resampling.BILINEAR,
+}
+_CV2_INTERPOLATIONS = {
+    "lanczos": "INTER_LANCZOS4",
+    "bicubic": "INTER_CUBIC",
+    "bilinear": "INTER_LINEAR",
+}
+# libjpeg scale-decode flags, largest reduction first.
+_CV2_REDUCED_FLAGS = ((8, "IMREAD_REDUCED_COLOR_8"), (4, "IMREAD_REDUCED_COLOR_4"), (2, "IMREAD_REDUCED_COLOR_2"))
 
 
 @dataclass(slots=True)
@@ -40,6 +62,14 @@ class GenerativeTransitionAdapter(Protocol):
     ) -> np.ndarray:
         ...
 
+    def generate_frames_batch(
+        self,
+        base_frames_bgr: list[np.ndarray],
+        prompt: str,
+        negative_prompt: str | None,
+    ) -> list[np.ndarray]:
+        ...
+
 
 class NullGenerativeTransitionAdapter:
     @property
@@ -55,11 +85,21 @@ class NullGenerativeTransitionAdapter:
         _ = prompt, negative_prompt
         return base_frame_bgr
 
+    def generate_frames_batch(
+        self,
+        base_frames_bgr: list[np.ndarray],
+        prompt: str,
+        negative_prompt: str | None,
+    ) -> list[np.ndarray]:
+        _ = prompt, negative_prompt
+        return list(base_frames_bgr)
+
 
 class DiffusersImage2ImageTransitionAdapter:
     def __init__(self) -> None:
         import torch  # noqa: PLC0415 - optional dependency
         from diffusers import AutoPipelineForImage2Image  # noqa: PLC0415 - optional dependency
+        from diffusers.models.attention_processor import AttnProcessor2_0  # noqa: PLC0415 - optional dependency
 
         self._torch = torch
         device = settings.transition_device.lower().strip()
@@ -67,15 +107,73 @@ class DiffusersImage2ImageTransitionAdapter:
             device = "cuda" if torch.cuda.is_available() else "cpu"
         self._device = device
 
-        dtype = torch.float16 if device == "cuda" else torch.float32
+        if device == "cuda":
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        else:
+            dtype = torch.float32
         self._pipe = AutoPipelineForImage2Image.from_pretrained(
             settings.transition_model_id,
             torch_dtype=dtype,
         )
+        self._lcm = settings.transition_scheduler.lower().strip() == "lcm"
+        if self._lcm:
+            from diffusers import LCMScheduler  # noqa: PLC0415 - optional dependency
+
+            # Distilled sampling: a handful of steps instead of the usual 20-50.
+            self._pipe.scheduler = LCMScheduler.from_config(self._pipe.scheduler.config)
+            if settings.transition_lcm_lora_id:
+                self._pipe.load_lora_weights(settings.transition_lcm_lora_id)
+                self._pipe.fuse_lora()
         self._pipe.to(device)
         self._pipe.set_progress_bar_config(disable=True)
+        # Fused SDPA attention (attention slicing would replace it with a slower sliced kernel),
+        # and channels_last for the conv-heavy UNet/VAE.
+        for module in (self._pipe.unet, self._pipe.vae):
+            module.set_attn_processor(AttnProcessor2_0())
+            module.to(memory_format=torch.channels_last)
+        # Uncompiled UNet and VAE decode, kept while a compiled pair is in use.
+        self._eager_modules: tuple[object, object] | None = None
         if device == "cuda":
-            self._pipe.enable_attention_slicing()
+            torch.backends.cudnn.benchmark = True
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
+            eager_modules = (self._pipe.unet, self._pipe.vae.decode)
+            compiled = settings.transition_use_tensorrt and self._compile_tensorrt(dtype)
+            if not compiled and settings.transition_torch_compile:
+                # Compiled once per worker process (the adapter is cached); every keyframe has
+                # the same shape, so later calls replay the captured CUDA graphs for both the
+                # per-step UNet and the per-batch VAE decode.
+                self._pipe.unet = torch.compile(self._pipe.unet, mode="reduce-overhead")
+                self._pipe.vae.decode = torch.compile(self._pipe.vae.decode, mode="reduce-overhead")
+                compiled = True
+            if compiled:
+                self._eager_modules = eager_modules
+
+    def _compile_tensorrt(self, dtype) -> bool:
+        try:
+            import torch_tensorrt  # noqa: PLC0415 - optional dependency; registers the backend
+        except ImportError:
+            logger.warning("torch_tensorrt is not installed; using torch.compile for transitions")
+            return False
+        # Replay each engine's launches from a recorded CUDA graph (older releases lack the switch).
+        set_cudagraphs_mode = getattr(getattr(torch_tensorrt, "runtime", None), "set_cudagraphs_mode", None)
+        if set_cudagraphs_mode is not None:
+            set_cudagraphs_mode(True)
+        # Generation size and batch are fixed by settings, so engines are built for static
+        # shapes on first use and reloaded from the on-disk cache by later worker processes.
+        _TRT_ENGINE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        options = {
+            "enabled_precisions": {dtype},
+            "cache_built_engines": True,
+            "reuse_cached_engines": True,
+            "engine_cache_dir": str(_TRT_ENGINE_CACHE_DIR),
+        }
+        torch = self._torch
+        self._pipe.unet = torch.compile(self._pipe.unet, backend="torch_tensorrt", dynamic=False, options=options)
+        self._pipe.vae.decode = torch.compile(
+            self._pipe.vae.decode, backend="torch_tensorrt", dynamic=False, options=options
+        )
+        return True
 
     @property
     def available(self) -> bool:
@@ -87,32 +185,68 @@ class DiffusersImage2ImageTransitionAdapter:
         prompt: str,
         negative_prompt: str | None,
     ) -> np.ndarray:
+        return self.generate_frames_batch([base_frame_bgr], prompt, negative_prompt)[0]
+
+    def generate_frames_batch(
+        self,
+        base_frames_bgr: list[np.ndarray],
+        prompt: str,
+        negative_prompt: str | None,
+    ) -> list[np.ndarray]:
         gen_w = max(64, int(settings.transition_generation_width))
         gen_h = max(64, int(settings.transition_generation_height))
 
-        base_rgb = base_frame_bgr[:, :, ::-1]
-        base_pil = Image.fromarray(base_rgb, mode="RGB").resize(
-            (gen_w, gen_h),
-            Image.Resampling.LANCZOS,
-        )
+        base_pils = [
+            bgr_to_pil(base_frame_bgr).resize(
+                (gen_w, gen_h),
+                Image.Resampling.LANCZOS,
+            )
+            for base_frame_bgr in base_frames_bgr
+        ]
+
+        num_inference_steps = settings.transition_num_inference_steps
+        guidance_scale = settings.transition_guidance_scale
+        if self._lcm:
+            # LCM is distilled without classifier-free guidance and saturates within a few steps.
+            num_inference_steps = min(num_inference_steps, _LCM_MAX_STEPS)
+            guidance_scale = 1.0
 
+        # One pipeline call denoises the whole batch, so weights are read once per step.
         kwargs: dict[str, object] = {
-            "prompt": prompt,
-            "image": base_pil,
+            "prompt": [prompt] * len(base_pils),
+            "image": base_pils,
             "strength": settings.transition_strength,
-            "guidance_scale": settings.transition_guidance_scale,
-            "num_inference_steps": settings.transition_num_inference_steps,
+            "guidance_scale": guidance_scale,
+            "num_inference_steps": num_inference_steps,
         }
         if negative_prompt:
-            kwargs["negative_prompt"] = negative_prompt
-
-        result = self._pipe(**kwargs).images[0]
-        result = result.resize(
-            (settings.target_width, settings.target_height),
-            Image.Resampling.LANCZOS,
-        )
-        out_rgb = np.array(result, dtype=np.uint8)
-        return out_rgb[:, :, ::-1]
+            kwargs["negative_prompt"] = [negative_prompt] * len(base_pils)
+
+        torch = self._torch
+        with torch.inference_mode():
+            # Keep the output on the device: resize, RGB -> BGR and uint8 conversion happen
+            # there, and the batch crosses to the host once as ready-to-encode frames.
+            try:
+                images = self._pipe(**kwargs, output_type="pt").images
+            except Exception:
+                if self._eager_modules is None:
+                    raise
+                # Compilation happens on the first call. Without this, a backend failure (no
+                # Triton, unsupported GPU) would turn every transition into the classic fallback.
+                logger.exception("compiled transition pipeline failed; falling back to eager modules")
+                self._pipe.unet, self._pipe.vae.decode = self._eager_modules
+                self._eager_modules = None
+                images = self._pipe(**kwargs, output_type="pt").images
+            images = torch.nn.functional.interpolate(
+                images.float(),
+                size=(settings.target_height, settings.target_width),
+                mode="bicubic",
+                align_corners=False,
+            )
+            frames_u8 = (
+                images.flip(1).mul_(255).round_().clamp_(0, 255).to(torch.uint8).permute(0, 2, 3, 1).contiguous()
+            )
+            return list(frames_u8.cpu().numpy())
 
 
 @lru_cache(maxsize=1)
@@ -132,36 +266,229 @@ def create_transition_adapter() -> GenerativeTransitionAdapter:
     return NullGenerativeTransitionAdapter()
 
 
-def _load_and_normalize(path: str) -> np.ndarray:
-    src = Image.open(path).convert("RGB")
-    w, h = src.size
+@lru_cache(maxsize=1)
+def _kernels() -> ModuleType:
+    # Deferred: the kernels load Numba, which API processes importing this module never need.
+    from app.video import _transition_kernels  # noqa: PLC0415 - lazy import
+
+    return _transition_kernels
+
+
+@lru_cache(maxsize=1)
+def _background_box_radii() -> np.ndarray:
+    return _kernels().gaussian_box_radii(_BACKGROUND_BLUR_RADIUS)
+
+
+@lru_cache(maxsize=1)
+def _import_cv2() -> ModuleType | None:
+    try:
+        import cv2  # noqa: PLC0415 - optional dependency
+    except ImportError:
+        return None
+    return cv2
+
+
+def _fit_geometry(w: int, h: int) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int]]:
+    """Contained foreground size, covering background size, background crop offset and paste offset."""
     s = min(settings.target_width / w, settings.target_height / h)
     w1 = max(1, int(round(w * s)))
     h1 = max(1, int(round(h * s)))
-
-    fg = src.resize((w1, h1), Image.Resampling.LANCZOS)
-
-    # Safe background pad policy.
     cover_s = max(settings.target_width / w, settings.target_height / h)
     cw = max(1, int(round(w * cover_s)))
     ch = max(1, int(round(h * cover_s)))
-    bg = src.resize((cw, ch), Image.Resampling.LANCZOS)
-    left = (cw - settings.target_width) // 2
-    top = (ch - settings.target_height) // 2
+    crop = ((cw - settings.target_width) // 2, (ch - settings.target_height) // 2)
+    paste = ((settings.target_width - w1) // 2, (settings.target_height - h1) // 2)
+    return (w1, h1), (cw, ch), crop, paste
+
+
+def _cv2_resize(cv2: ModuleType, src: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    if size[0] < src.shape[1]:
+        # Area averaging is OpenCV's anti-aliased downscale; its other filters alias when shrinking.
+        interpolation = cv2.INTER_AREA
+    else:
+        name = _CV2_INTERPOLATIONS.get(settings.transition_resample_filter.lower(), "INTER_CUBIC")
+        interpolation = getattr(cv2, name)
+    return cv2.resize(src, size, interpolation=interpolation)
+
+
+def _load_and_normalize_cv2(cv2: ModuleType, path: str) -> np.ndarray | None:
+    target_w, target_h = settings.target_width, settings.target_height
+    with Image.open(path) as img:
+        # Header only: picks the JPEG decode scale, matching the PIL path's draft size.
+        src_w, src_h = img.size
+        is_jpeg = img.format == "JPEG"
+    flags = cv2.IMREAD_COLOR
+    if is_jpeg:
+        for factor, name in _CV2_REDUCED_FLAGS:
+            if src_w // factor >= target_w * 2 and src_h // factor >= target_h * 2:
+                flags = getattr(cv2, name)
+                break
+    # imdecode instead of imread so non-ASCII paths work everywhere; EXIF orientation is
+    # ignored like on the PIL path.
+    src = cv2.imdecode(np.fromfile(path, dtype=np.uint8), flags | cv2.IMREAD_IGNORE_ORIENTATION)
+    if src is None:
+        return None
+
+    (w1, h1), (cw, ch), (left, top), (x, y) = _fit_geometry(src.shape[1], src.shape[0])
+    fg = _cv2_resize(cv2, src, (w1, h1))
+    bg = _cv2_resize(cv2, src, (cw, ch))[top : top + target_h, left : left + target_w]
+    # Same box passes as the Numba kernel; cv2.blur is a constant-time-per-pixel running sum.
+    for r in _background_box_radii():
+        k = 2 * int(r) + 1
+        bg = cv2.blur(bg, (k, k), borderType=cv2.BORDER_REPLICATE)
+    bg[y : y + h1, x : x + w1] = fg
+    return bg
+
+
+def _load_and_normalize(path: str) -> np.ndarray:
+    cv2 = _import_cv2()
+    if cv2 is not None:
+        # OpenCV decodes straight to BGR, so there is no RGB -> BGR pass at the end.
+        frame = _load_and_normalize_cv2(cv2, path)
+        if frame is not None:
+            return frame
+
+    with Image.open(path) as img:
+        # JPEGs decode at a reduced DCT scale while still at least 2x the target in each
+        # dimension, so the resizes below are always downscales.
+        img.draft("RGB", (settings.target_width * 2, settings.target_height * 2))
+        src = img.convert("RGB")
+    resample = _RESAMPLE_FILTERS.get(settings.transition_resample_filter.lower(), Image.Resampling.BICUBIC)
+    (w1, h1), (cw, ch), (left, top), (x, y) = _fit_geometry(*src.size)
+
+    fg = src.resize((w1, h1), resample)
+
+    # Safe background pad policy.
+    bg = src.resize((cw, ch), resample)
     bg = bg.crop((left, top, left + settings.target_width, top + settings.target_height))
-    bg = bg.filter(ImageFilter.GaussianBlur(radius=22))
 
-    canvas = np.array(bg, dtype=np.uint8)
-    x = (settings.target_width - w1) // 2
-    y = (settings.target_height - h1) // 2
-    canvas[y : y + h1, x : x + w1] = np.array(fg, dtype=np.uint8)
-    return canvas[:, :, ::-1]  # RGB -> BGR
+    if _kernels().NUMBA_AVAILABLE:
+        # Blur, paste and RGB -> BGR in compiled passes, returning a contiguous BGR canvas.
+        return _kernels().blur_composite_bgr(
+            np.asarray(bg, dtype=np.uint8),
+            np.asarray(fg, dtype=np.uint8),
+            x,
+            y,
+            _background_box_radii(),
+        )
+
+    bg = bg.filter(ImageFilter.GaussianBlur(radius=_BACKGROUND_BLUR_RADIUS))
+    bg.paste(fg, (x, y))
+    return pil_to_bgr(bg)
+
+
+class _TransitionFrames(Sequence[np.ndarray]):
+    """Transition frames computed on demand instead of held in memory all at once.
+
+    The ends are frame_a/frame_b themselves, indices in `generated` are keyframes from the
+    adapter, and everything else is a linear crossfade computed when it is read.
+    """
+
+    def __init__(self, frame_a: np.ndarray, frame_b: np.ndarray, total_frames: int) -> None:
+        self._frame_a = frame_a
+        self._frame_b = frame_b
+        # 8.8 fixed point in uint16: 255 * 256 + 128 still fits, so no float pass and no clip.
+        # Inputs are widened once and the scratch buffers are reused for every frame.
+        self._a16 = frame_a.astype(np.uint16)
+        self._b16 = frame_b.astype(np.uint16)
+        self._mixed = np.empty_like(self._a16)
+        self._scratch = np.empty_like(self._b16)
+        self._weights = np.rint(np.linspace(0, 256, total_frames)).astype(np.uint16)
+        self.generated: dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def __getitem__(self, idx: int) -> np.ndarray:  # type: ignore[override]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        if idx == 0:
+            return self._frame_a
+        if idx == len(self) - 1:
+            return self._frame_b
+        frame = self.generated.get(idx)
+        return frame if frame is not None else self.blended(idx)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return (self[idx] for idx in range(len(self)))
+
+    def blended(self, idx: int) -> np.ndarray:
+        b_weight = self._weights[idx]
+        np.multiply(self._a16, np.uint16(256) - b_weight, out=self._mixed)
+        np.multiply(self._b16, b_weight, out=self._scratch)
+        self._mixed += self._scratch
+        self._mixed += np.uint16(128)
+        self._mixed >>= np.uint16(8)
+        return self._mixed.astype(np.uint8)
+
+    def blended_batch(self, indices: list[int]) -> list[np.ndarray]:
+        return [self.blended(idx) for idx in indices]
+
+
+def _generate_batch(
+    adapter: GenerativeTransitionAdapter,
+    base_frames_bgr: list[np.ndarray],
+    prompt: str,
+    negative_prompt: str | None,
+) -> list[np.ndarray]:
+    batch = getattr(adapter, "generate_frames_batch", None)
+    if batch is None:
+        return [
+            adapter.generate_frame(frame, prompt=prompt, negative_prompt=negative_prompt)
+            for frame in base_frames_bgr
+        ]
+    return batch(base_frames_bgr, prompt=prompt, negative_prompt=negative_prompt)
 
 
-def _blend(a_bgr: np.ndarray, b_bgr: np.ndarray, alpha: float) -> np.ndarray:
-    alpha = min(1.0, max(0.0, alpha))
-    mixed = (a_bgr.astype(np.float32) * (1.0 - alpha)) + (b_bgr.astype(np.float32) * alpha)
-    return np.clip(mixed, 0, 255).astype(np.uint8)
+def _generate_keyframes(
+    adapter: GenerativeTransitionAdapter,
+    frames: _TransitionFrames,
+    keyframes: list[int],
+    batch_size: int,
+    prompt: str,
+    negative_prompt: str | None,
+) -> None:
+    batches = [keyframes[start : start + batch_size] for start in range(0, len(keyframes), batch_size)]
+    if not batches:
+        return
+    # The next batch is blended on a helper thread while the adapter (which releases the GIL)
+    # runs the current one. Only that thread calls frames.blended, whose scratch buffers are shared.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(frames.blended_batch, batches[0])
+        for i, batch in enumerate(batches):
+            base_frames = pending.result()
+            if i + 1 < len(batches):
+                pending = pool.submit(frames.blended_batch, batches[i + 1])
+            generated = _generate_batch(adapter, base_frames, prompt, negative_prompt)
+            for idx, frame in zip(batch, generated, strict=True):
+                frames.generated[idx] = frame
+
+
+@lru_cache(maxsize=4)
+def _load_and_normalize_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    target_width: int,
+    target_height: int,
+) -> np.ndarray:
+    """Read-only `_load_and_normalize` result, shared by consecutive transitions.
+
+    The b image of one transition is the a image of the next. mtime_ns/size and the target
+    size are part of the cache key, so rewritten files and changed settings are reloaded.
+    """
+    frame = _load_and_normalize(path)
+    frame.setflags(write=False)
+    return frame
+
+
+def _load_frame(path: str) -> np.ndarray:
+    st = os.stat(path)
+    return _load_and_normalize_cached(
+        path, st.st_mtime_ns, st.st_size, settings.target_width, settings.target_height
+    )
 
 
 def _sample_indices(total_frames: int, step: int) -> list[int]:
@@ -170,22 +497,32 @@ def _sample_indices(total_frames: int, step: int) -> list[int]:
     step = max(1, step)
     indices = list(range(1, total_frames - 1, step))
     last_mid = total_frames - 2
-    if last_mid not in indices:
+    # The range is already ascending and unique; only its tail can equal last_mid.
+    if indices[-1] != last_mid:
         indices.append(last_mid)
-    return sorted(set(indices))
+    return indices
 
 
-def _animal_count(detector: AnimalDetector, frame_bgr: np.ndarray, strict: bool) -> tuple[int, str | None]:
-    if not detector.available:
-        if strict:
-            return -1, "animal detector unavailable in strict mode"
-        return 0, None
-    detections = detector.detect_animals(frame_bgr)
-    return len(detections), None
+@lru_cache(maxsize=2)
+def _full_mask(height: int, width: int) -> np.ndarray:
+    mask = np.full((height, width), 255, dtype=np.uint8)
+    mask.setflags(write=False)
+    return mask
+
+
+def _same_frame(expected: np.ndarray, actual: np.ndarray) -> bool:
+    return actual is expected or np.array_equal(actual, expected)
+
+
+def _animal_counts(detector: AnimalDetector, frames_bgr: list[np.ndarray]) -> list[int]:
+    batch = getattr(detector, "detect_animals_batch", None)
+    if batch is None:
+        return [len(detector.detect_animals(frame)) for frame in frames_bgr]
+    return [len(detections) for detections in batch(frames_bgr)]
 
 
 def _validate_transition_safety(
-    frames: list[np.ndarray],
+    frames: Sequence[np.ndarray],
     frame_a: np.ndarray,
     frame_b: np.ndarray,
     detector: AnimalDetector,
@@ -193,30 +530,31 @@ def _validate_transition_safety(
     if not frames:
         return False, "frames are empty"
 
-    full_mask = np.full((settings.target_height, settings.target_width), 255, dtype=np.uint8)
-    start_check = check_protected_region_unchanged(frame_a, frames[0], full_mask, max_changed_ratio=0.0)
-    if not start_check.passed:
-        return False, f"first frame mismatch: {start_check.reason}"
-
-    end_check = check_protected_region_unchanged(frame_b, frames[-1], full_mask, max_changed_ratio=0.0)
-    if not end_check.passed:
-        return False, f"last frame mismatch: {end_check.reason}"
+    full_mask = _full_mask(settings.target_height, settings.target_width)
+    # build_transition_clip places frame_a/frame_b themselves at the ends, so the mask diff
+    # only runs when a caller passed different arrays.
+    if not _same_frame(frame_a, frames[0]):
+        start_check = check_protected_region_unchanged(frame_a, frames[0], full_mask, max_changed_ratio=0.0)
+        if not start_check.passed:
+            return False, f"first frame mismatch: {start_check.reason}"
 
-    strict = settings.strict_safety_checks
-    base_a, err = _animal_count(detector, frame_a, strict)
-    if err:
-        return False, err
-    base_b, err = _animal_count(detector, frame_b, strict)
-    if err:
-        return False, err
+    if not _same_frame(frame_b, frames[-1]):
+        end_check = check_protected_region_unchanged(frame_b, frames[-1], full_mask, max_changed_ratio=0.0)
+        if not end_check.passed:
+            return False, f"last frame mismatch: {end_check.reason}"
 
-    baseline = max(base_a, base_b)
+    if not detector.available:
+        if settings.strict_safety_checks:
+            return False, "animal detector unavailable in strict mode"
+        return True, None
+
+    # Endpoints and sampled frames go through the detector as one batch.
+    indices = _sample_indices(len(frames), settings.transition_safety_sample_step)
+    counts = _animal_counts(detector, [frame_a, frame_b, *(frames[idx] for idx in indices)])
+    baseline = max(counts[0], counts[1])
     allowed = max(0, int(settings.transition_allowed_extra_animals))
 
-    for idx in _sample_indices(len(frames), settings.transition_safety_sample_step):
-        count, err = _animal_count(detector, frames[idx], strict)
-        if err:
-            return False, err
+    for idx, count in zip(indices, counts[2:], strict=True):
         if count > baseline + allowed:
             return False, (
                 f"extra animal detected on frame {idx}: count={count}, "
@@ -226,35 +564,41 @@ def _validate_transition_safety(
     return True, None
 
 
-def _write_frames_to_video(frames: list[np.ndarray], output_path: str) -> str:
+def _write_frames_to_video(frames: Sequence[np.ndarray], output_path: str) -> str:
+    if not frames:
+        raise ValueError("frames must not be empty")
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory(prefix="transition_frames_") as tmp_dir:
-        tmp = Path(tmp_dir)
-        for i, frame_bgr in enumerate(frames):
-            frame_rgb = frame_bgr[:, :, ::-1]
-            Image.fromarray(frame_rgb, mode="RGB").save(tmp / f"frame_{i:06d}.png")
-
-        cmd = [
-            settings.ffmpeg_path,
-            "-y",
-            "-framerate",
-            str(settings.target_fps),
-            "-i",
-            str(tmp / "frame_%06d.png"),
-            "-r",
-            str(settings.target_fps),
-            "-pix_fmt",
-            settings.output_pixel_format,
-            "-c:v",
-            settings.output_video_codec,
-            str(out),
-        ]
-        process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if process.returncode != 0:
-            raise RuntimeError(process.stderr.strip() or "ffmpeg frame-to-video failed")
-
+    # Raw BGR frames go straight to ffmpeg's stdin; no intermediate PNG encode/decode or disk I/O.
+    height, width = frames[0].shape[:2]
+    cmd = [
+        settings.ffmpeg_path,
+        "-y",
+        "-f",
+        "rawvideo",
+        "-vcodec",
+        "rawvideo",
+        "-s",
+        f"{width}x{height}",
+        "-pix_fmt",
+        "bgr24",
+        "-framerate",
+        str(settings.target_fps),
+        "-i",
+        "pipe:0",
+        "-r",
+        str(settings.target_fps),
+        "-pix_fmt",
+        settings.output_pixel_format,
+        *video_encoder_args(),
+        str(out),
+    ]
+    run_ffmpeg(
+        cmd,
+        "ffmpeg frame-to-video failed",
+        stdin_chunks=(np.ascontiguousarray(frame, dtype=np.uint8) for frame in frames),
+    )
     return str(out)
 
 
@@ -301,13 +645,10 @@ def _build_classic_transition_clip(
         str(settings.target_fps),
         "-pix_fmt",
         settings.output_pixel_format,
-        "-c:v",
-        settings.output_video_codec,
+        *video_encoder_args(),
         str(out),
     ]
-    process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if process.returncode != 0:
-        raise RuntimeError(process.stderr.strip() or "ffmpeg classic transition build failed")
+    run_ffmpeg(cmd, "ffmpeg classic transition build failed")
     return str(out)
 
 
@@ -325,8 +666,8 @@ def build_transition_clip(
     if not prompt.strip():
         raise ValueError("prompt is required for generative transition")
 
-    frame_a = _load_and_normalize(image_a_path)
-    frame_b = _load_and_normalize(image_b_path)
+    frame_a = _load_frame(image_a_path)
+    frame_b = _load_frame(image_b_path)
 
     total_frames = max(2, int(duration_seconds * settings.target_fps))
     adapter = create_transition_adapter()
@@ -358,25 +699,14 @@ def build_transition_clip(
             continue
 
         try:
-            frames: list[np.ndarray] = []
+            # Keep runtime bounded: only every gen_step-th inner frame is generated; the
+            # rest are crossfaded on demand while validating and while piping to ffmpeg, so
+            # only the keyframes are held in memory.
+            frames = _TransitionFrames(frame_a, frame_b, total_frames)
             gen_step = max(1, int(settings.transition_generation_step))
-            for idx in range(total_frames):
-                alpha = idx / (total_frames - 1)
-                base = _blend(frame_a, frame_b, alpha)
-                if idx == 0:
-                    frame = frame_a.copy()
-                elif idx == total_frames - 1:
-                    frame = frame_b.copy()
-                elif idx % gen_step != 0:
-                    # Keep runtime bounded: use blended frame between generated keyframes.
-                    frame = base
-                else:
-                    frame = adapter.generate_frame(base, prompt=prompt, negative_prompt=negative_prompt)
-                frames.append(frame)
-
-            # Hard enforce first/last exactness.
-            frames[0] = frame_a.copy()
-            frames[-1] = frame_b.copy()
+            batch_size = max(1, int(settings.transition_generation_batch_size))
+            keyframes = [idx for idx in range(1, total_frames - 1) if idx % gen_step == 0]
+            _generate_keyframes(adapter, frames, keyframes, batch_size, prompt, negative_prompt)
 
             safety_ok, safety_reason = _validate_transition_safety(frames, frame_a, frame_b, detector)
             if not safety_ok:
@@ -14,6 +14,7 @@ source .venv/bin/activate
 
 CELERY_WORKER_POOL="${CELERY_WORKER_POOL:-solo}"
 CELERY_WORKER_CONCURRENCY="${CELERY_WORKER_CONCURRENCY:-1}"
+CELERY_WORKER_QUEUES="${CELERY_WORKER_QUEUES:-default,${CELERY_PIPELINE_QUEUE:-pipeline}}"
 ENABLE_SQLITE_FALLBACK="${ENABLE_SQLITE_FALLBACK:-1}"
 HEALTH_CHECK_RETRIES="${HEALTH_CHECK_RETRIES:-30}"
 HEALTH_CHECK_INTERVAL_SEC="${HEALTH_CHECK_INTERVAL_SEC:-1}"
@@ -86,6 +87,8 @@ else
   echo "[ok] database connect check passed"
 fi
 
+python -m app.init_db
+
 # avoid duplicated workers/servers if script is executed multiple times
 pkill -f "uvicorn app.main:app" >/dev/null 2>&1 || true
 pkill -f "celery -A app.celery_app worker" >/dev/null 2>&1 || true
@@ -94,12 +97,12 @@ sleep 1
 nohup uvicorn app.main:app --host 0.0.0.0 --port 18765 >/tmp/memorialtube_api.log 2>&1 &
 API_PID=$!
 
-nohup celery -A app.celery_app worker -l info --pool "${CELERY_WORKER_POOL}" --concurrency "${CELERY_WORKER_CONCURRENCY}" >/tmp/memorialtube_worker.log 2>&1 &
+nohup celery -A app.celery_app worker -l info -Q "${CELERY_WORKER_QUEUES}" --pool "${CELERY_WORKER_POOL}" --concurrency "${CELERY_WORKER_CONCURRENCY}" >/tmp/memorialtube_worker.log 2>&1 &
 WORKER_PID=$!
 
 echo "[ok] API PID: ${API_PID}"
 echo "[ok] Worker PID: ${WORKER_PID}"
-echo "[ok] Worker pool: ${CELERY_WORKER_POOL} (concurrency=${CELERY_WORKER_CONCURRENCY})"
+echo "[ok] Worker pool: ${CELERY_WORKER_POOL} (concurrency=${CELERY_WORKER_CONCURRENCY}, queues=${CELERY_WORKER_QUEUES})"
 echo "[ok] API log: /tmp/memorialtube_api.log"
 echo "[ok] Worker log: /tmp/memorialtube_worker.log"
 
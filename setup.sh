@@ -149,4 +149,5 @@ fi
 log "ffmpeg detected at ${ffmpeg_path}"
 log "Setup completed successfully."
 log "Activate virtualenv: source ${VENV_DIR}/bin/activate"
+log "Create DB schema (once per deploy): python -m app.init_db"
 log "Run API: uvicorn app.main:app --host 0.0.0.0 --port 18765 --reload"
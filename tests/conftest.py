@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+
+# app.db builds its engine from settings at import time; keep it off the Postgres default.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+import app.models  # noqa: E402, F401 - registers the tables on Base.metadata
+from app import cache  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.db import Base, _tune_sqlite  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "memorialtube.db"
+
+
+@pytest.fixture
+def db_engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    _tune_sqlite(engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    session = sessionmaker(bind=db_engine, autocommit=False, autoflush=False, class_=Session)()
+    yield session
+    session.close()
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the sync and async redis clients the runtime cache uses."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.deleted: list[str] = []
+
+    def delete(self, key: str) -> None:
+        self.deleted.append(key)
+        self.store.pop(key, None)
+
+    async def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, px: int) -> None:
+        self.store[key] = value.encode()
+
+
+@pytest.fixture
+def runtime_cache(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(settings, "job_runtime_cache_url", "redis://cache.invalid/0")
+    monkeypatch.setattr(settings, "job_runtime_cache_ttl_ms", 1000)
+    monkeypatch.setattr(cache, "_breaker", cache.CircuitBreaker(3, 30.0))
+    monkeypatch.setattr(cache, "_sync_client", lambda: fake)
+    monkeypatch.setattr(cache, "_async_client", lambda: fake)
+    return fake
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app import crud
+from app.models import Job, JobRuntime, JobStatus, ProjectRun
+
+
+@pytest.fixture
+def statements(db_engine):
+    seen: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        seen.append(statement.split(None, 1)[0].upper())
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(db_engine, "before_cursor_execute", record)
+
+
+def _runtime(db, job_id: str) -> JobRuntime:
+    db.expire_all()
+    return crud.get_job_runtime(db, job_id)
+
+
+def test_create_job_adds_queued_runtime(db):
+    job = crud.create_job(db, "test_render")
+
+    assert job.status is JobStatus.QUEUED
+    runtime = _runtime(db, job.id)
+    assert (runtime.stage, runtime.progress_percent, runtime.cancel_requested) == ("queued", 0, False)
+
+
+@pytest.mark.parametrize(
+    ("status", "progress", "expected"),
+    [
+        (JobStatus.PROCESSING, 0, ("processing", 1)),
+        (JobStatus.PROCESSING, 100, ("processing", 99)),
+        (JobStatus.SUCCEEDED, 40, ("completed", 100)),
+        (JobStatus.FAILED, 100, ("failed", 99)),
+    ],
+)
+def test_set_job_status_updates_runtime(db, status, progress, expected):
+    job = crud.create_job(db, "test_render")
+    crud.upsert_job_runtime(db, job.id, progress_percent=progress)
+
+    updated = crud.set_job_status(db, job.id, status, error_message="boom" if status is JobStatus.FAILED else None)
+
+    assert updated.status is status
+    runtime = _runtime(db, job.id)
+    assert (runtime.stage, runtime.progress_percent) == expected
+    if status is JobStatus.FAILED:
+        assert updated.error_message == "boom"
+        assert runtime.detail_message == "boom"
+
+
+def test_set_job_status_commits_once(db):
+    job = crud.create_job(db, "test_render")
+    commits: list[object] = []
+    event.listen(db, "after_commit", commits.append)
+
+    crud.set_job_status(db, job.id, JobStatus.SUCCEEDED, result_message="done")
+
+    assert len(commits) == 1
+
+
+def test_set_job_status_rolls_back_job_when_runtime_update_fails(db, monkeypatch):
+    job = crud.create_job(db, "test_render")
+    broken = update(JobRuntime).values(progress_percent=text("no_such_column"))
+    monkeypatch.setattr(crud, "_runtime_status_update", lambda *_args: broken)
+
+    with pytest.raises(OperationalError):
+        crud.set_job_status(db, job.id, JobStatus.SUCCEEDED, result_message="done")
+
+    db.expire_all()
+    stored = crud.get_job(db, job.id)
+    assert stored.status is JobStatus.QUEUED
+    assert stored.result_message is None
+
+
+def test_set_job_status_unknown_job(db):
+    with pytest.raises(ValueError, match="Job not found"):
+        crud.set_job_status(db, "missing", JobStatus.SUCCEEDED)
+
+
+def test_set_job_status_keeps_canceled_runtime(db):
+    job = crud.create_job(db, "test_render")
+    crud.mark_job_canceled(db, job.id, reason="stop")
+
+    crud.set_job_status(db, job.id, JobStatus.FAILED, error_message="late failure")
+
+    runtime = _runtime(db, job.id)
+    assert (runtime.stage, runtime.detail_message, runtime.cancel_requested) == ("canceled", "stop", True)
+
+
+def test_upsert_job_runtime_updates_only_given_fields(db, statements):
+    job = crud.create_job(db, "test_render")
+    crud.upsert_job_runtime(db, job.id, stage="render", detail_message="rendering")
+    job_id = job.id
+    statements.clear()
+
+    runtime = crud.upsert_job_runtime(db, job_id, progress_percent=250)
+
+    assert (runtime.stage, runtime.progress_percent, runtime.detail_message) == ("render", 100, "rendering")
+    # One INSERT .. ON CONFLICT DO UPDATE .. RETURNING; reading the result needs no SELECT.
+    assert statements == ["INSERT"]
+
+
+def test_upsert_job_runtime_inserts_missing_row(db):
+    job = Job(job_type="test_render", status=JobStatus.QUEUED)
+    db.add(job)
+    db.commit()
+
+    runtime = crud.upsert_job_runtime(db, job.id, progress_percent=-5)
+
+    assert (runtime.stage, runtime.progress_percent, runtime.cancel_requested) == ("queued", 0, False)
+    assert _runtime(db, job.id).progress_percent == 0
+
+
+def test_cancel_flow(db):
+    job = crud.create_job(db, "test_render")
+    assert not crud.is_cancel_requested(db, job.id)
+
+    runtime = crud.request_job_cancel(db, job.id)
+
+    assert (runtime.stage, runtime.cancel_requested) == ("cancel_requested", True)
+    assert crud.is_cancel_requested(db, job.id)
+
+
+def test_runtime_writes_invalidate_cache(db, runtime_cache):
+    job = crud.create_job(db, "test_render")
+    key = f"jobruntime:{job.id}"
+
+    crud.upsert_job_runtime(db, job.id, progress_percent=10)
+    crud.set_job_status(db, job.id, JobStatus.PROCESSING)
+    crud.request_job_cancel(db, job.id)
+
+    assert runtime_cache.deleted == [key, key, key]
+
+
+def test_get_latest_active_project_job(db):
+    project = crud.create_project(
+        db,
+        name="memorial",
+        transition_duration_seconds=6,
+        transition_prompt="soft light",
+        transition_negative_prompt=None,
+        last_clip_duration_seconds=4,
+        last_clip_motion_style="zoom_in",
+        bgm_path=None,
+        bgm_volume=0.15,
+    )
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    jobs = []
+    for offset, status in enumerate([JobStatus.QUEUED, JobStatus.PROCESSING, JobStatus.SUCCEEDED]):
+        job = crud.create_job(db, "pipeline_render")
+        run = crud.create_project_run(db, project.id, job.id)
+        db.execute(update(ProjectRun).where(ProjectRun.id == run.id).values(created_at=base + timedelta(minutes=offset)))
+        db.commit()
+        if status is not JobStatus.QUEUED:
+            crud.set_job_status(db, job.id, status)
+        jobs.append(job)
+
+    assert crud.get_latest_active_project_job(db, project.id).id == jobs[1].id
+
+    crud.set_job_status(db, jobs[1].id, JobStatus.FAILED)
+    crud.set_job_status(db, jobs[0].id, JobStatus.FAILED)
+    assert crud.get_latest_active_project_job(db, project.id) is None
+
+
+def test_bulk_add_assets_returns_loaded_rows(db, statements):
+    project = crud.create_project(
+        db,
+        name="assets",
+        transition_duration_seconds=6,
+        transition_prompt="soft light",
+        transition_negative_prompt=None,
+        last_clip_duration_seconds=4,
+        last_clip_motion_style="zoom_in",
+        bgm_path=None,
+        bgm_volume=0.15,
+    )
+    rows = [
+        {"order_index": idx, "file_name": f"{idx}.jpg", "file_path": f"/data/{idx}.jpg", "width": 800, "height": 600}
+        for idx in range(3)
+    ]
+    project_id = project.id
+    statements.clear()
+
+    assets = crud.bulk_add_assets(db, project_id, rows)
+
+    assert [(a.order_index, a.file_name, a.project_id) for a in assets] == [(i, f"{i}.jpg", project_id) for i in range(3)]
+    assert all(a.id and a.created_at for a in assets)
+    # One executemany INSERT .. RETURNING; the commit does not expire the returned rows.
+    assert statements == ["INSERT"]
+    assert [a.id for a in crud.list_assets_by_project(db, project_id)] == [a.id for a in assets]
+
+
+def test_list_jobs_with_runtime_async(db, db_path):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    jobs = [crud.create_job(db, "test_render") for _ in range(3)]
+    for offset, job in enumerate(jobs):
+        db.execute(update(Job).where(Job.id == job.id).values(created_at=base + timedelta(minutes=offset)))
+    db.execute(JobRuntime.__table__.delete().where(JobRuntime.job_id == jobs[1].id))
+    db.commit()
+    crud.upsert_job_runtime(db, jobs[2].id, stage="render", progress_percent=50)
+
+    async def fetch():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine) as session:
+                return await crud.list_jobs_with_runtime_async(session, limit=2)
+        finally:
+            await engine.dispose()
+
+    rows = asyncio.run(fetch())
+
+    assert [job.id for job, _ in rows] == [jobs[2].id, jobs[1].id]
+    assert (rows[0][1].stage, rows[0][1].progress_percent) == ("render", 50)
+    assert rows[1][1] is None
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import crud
+from app.db import get_async_db, get_db
+from app.main import create_app
+from app.models import Job, JobRuntime, JobStatus
+
+
+@pytest.fixture
+def async_engine(db_path, db_engine):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    yield engine
+    engine.sync_engine.dispose()
+
+
+@pytest.fixture
+def client(db, async_engine):
+    sessions = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_async_db():
+        async with sessions() as session:
+            yield session
+
+    app = create_app()
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_async_db] = override_async_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def jobs(db):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    created = [crud.create_job(db, "test_render") for _ in range(3)]
+    for offset, job in enumerate(created):
+        db.execute(update(Job).where(Job.id == job.id).values(created_at=base + timedelta(minutes=offset)))
+    db.execute(JobRuntime.__table__.delete().where(JobRuntime.job_id == created[0].id))
+    db.commit()
+    crud.upsert_job_runtime(db, created[2].id, stage="render", progress_percent=40, detail_message="rendering")
+    return [job.id for job in created]
+
+
+def test_list_jobs_joins_runtimes_in_one_query(client, jobs, async_engine):
+    queries: list[str] = []
+    event.listen(async_engine.sync_engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+
+    response = client.get("/api/v1/jobs", params={"limit": 3})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body] == list(reversed(jobs))
+    assert (body[0]["stage"], body[0]["progress_percent"], body[0]["detail_message"]) == ("render", 40, "rendering")
+    assert body[1]["stage"] == "queued"
+    assert body[2]["stage"] is None and body[2]["cancel_requested"] is None
+    assert len([q for q in queries if q.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_get_job_and_runtime(client, jobs):
+    job = client.get(f"/api/v1/jobs/{jobs[2]}").json()
+    runtime = client.get(f"/api/v1/jobs/{jobs[2]}/runtime").json()
+
+    assert (job["status"], job["stage"], job["progress_percent"]) == ("queued", "render", 40)
+    assert (runtime["job_id"], runtime["stage"], runtime["progress_percent"]) == (jobs[2], "render", 40)
+    assert client.get("/api/v1/jobs/missing").status_code == 404
+    assert client.get(f"/api/v1/jobs/{jobs[0]}/runtime").status_code == 404
+
+
+def test_runtime_polling_cache_is_invalidated_by_writes(client, jobs, db, runtime_cache):
+    job_id = jobs[2]
+    key = f"jobruntime:{job_id}"
+
+    first = client.get(f"/api/v1/jobs/{job_id}/runtime").json()
+    assert key in runtime_cache.store
+
+    # A direct write that bypasses crud stays invisible while the cached entry lives.
+    db.execute(update(JobRuntime).where(JobRuntime.job_id == job_id).values(progress_percent=55))
+    db.commit()
+    assert client.get(f"/api/v1/jobs/{job_id}/runtime").json() == first
+
+    crud.upsert_job_runtime(db, job_id, progress_percent=70)
+    assert key not in runtime_cache.store
+    assert client.get(f"/api/v1/jobs/{job_id}/runtime").json()["progress_percent"] == 70
+
+
+def test_cancel_job(client, jobs, db):
+    response = client.post(f"/api/v1/jobs/{jobs[1]}/cancel")
+
+    assert response.status_code == 202
+    body = response.json()
+    assert (body["status"], body["stage"], body["cancel_requested"]) == ("queued", "cancel_requested", True)
+
+    crud.set_job_status(db, jobs[2], JobStatus.SUCCEEDED)
+    finished = client.post(f"/api/v1/jobs/{jobs[2]}/cancel").json()
+    assert (finished["status"], finished["stage"], finished["cancel_requested"]) == ("succeeded", "completed", False)
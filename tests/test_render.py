@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.video import render
+from app.video.probe import StreamInfo
+
+_MATCHING = StreamInfo(
+    codec="h264",
+    profile="High",
+    width=1600,
+    height=900,
+    frame_rate="24/1",
+    pix_fmt="yuv420p",
+    sample_aspect_ratio="1:1",
+)
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    for name, value in {
+        "target_width": 1600,
+        "target_height": 900,
+        "target_fps": 24,
+        "output_pixel_format": "yuv420p",
+        "output_video_codec": "libx264",
+        "hw_encoder": "none",
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    render._normalize_vf.cache_clear()
+
+    calls: list[dict[str, object]] = []
+
+    def fake_run_ffmpeg(cmd, error_message, **_kwargs):
+        call = {"cmd": cmd}
+        if "concat" in cmd:
+            # The list file lives in a temporary directory that is gone once the render returns.
+            call["list"] = Path(cmd[cmd.index("-i") + 1]).read_text(encoding="utf-8")
+        calls.append(call)
+
+    monkeypatch.setattr(render, "run_ffmpeg", fake_run_ffmpeg)
+    yield calls
+    render._normalize_vf.cache_clear()
+
+
+@pytest.fixture
+def clips(tmp_path):
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"clip {idx}'s.mp4"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+def _probe_with(monkeypatch, infos: dict[str, StreamInfo | None]) -> None:
+    monkeypatch.setattr(render, "probe_file", lambda path: infos.get(Path(path).name, _MATCHING))
+
+
+def test_matching_clips_are_stream_copied(clips, ffmpeg_calls, monkeypatch, tmp_path):
+    _probe_with(monkeypatch, {})
+
+    output = render.build_final_render(clips, str(tmp_path / "out" / "final.mp4"))
+
+    (call,) = ffmpeg_calls
+    cmd = call["cmd"]
+    assert cmd[cmd.index("-f") + 1] == "concat"
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert "-filter_complex" not in cmd
+    assert "-an" in cmd
+    assert cmd[-1] == output
+    expected = "".join("file '{}'\n".format(clip.replace("'", "'\\''")) for clip in clips)
+    assert call["list"] == expected
+
+
+@pytest.mark.parametrize(
+    "mismatch",
+    [
+        None,
+        StreamInfo("h264", "High", 1600, 900, "30/1", "yuv420p", "1:1"),
+        StreamInfo("h264", "Main", 1600, 900, "24/1", "yuv420p", "1:1"),
+        StreamInfo("h264", "High", 1600, 900, "24/1", "yuv420p", "4:3"),
+    ],
+    ids=["unprobed", "frame-rate", "profile", "sar"],
+)
+def test_mismatched_clips_are_reencoded_in_one_pass(clips, ffmpeg_calls, monkeypatch, tmp_path, mismatch):
+    _probe_with(monkeypatch, {Path(clips[1]).name: mismatch})
+
+    render.build_final_render(clips, str(tmp_path / "final.mp4"))
+
+    (call,) = ffmpeg_calls
+    cmd = call["cmd"]
+    assert [cmd[idx + 1] for idx, arg in enumerate(cmd) if arg == "-i"] == clips
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert graph.endswith("[v0][v1][v2]concat=n=3:v=1:a=0[outv]")
+    assert graph.count("fps=24,setsar=1,format=yuv420p") == 3
+    assert cmd[cmd.index("-map") + 1] == "[outv]"
+    assert cmd[cmd.index("-c:v") + 1] == "libx264"
+
+
+def test_bgm_input_index_follows_the_clip_inputs(clips, ffmpeg_calls, monkeypatch, tmp_path):
+    bgm = tmp_path / "bgm.mp3"
+    bgm.write_bytes(b"")
+
+    _probe_with(monkeypatch, {})
+    render.build_final_render(clips, str(tmp_path / "copy.mp4"), bgm_path=str(bgm), bgm_volume=0.3)
+    _probe_with(monkeypatch, {Path(clips[0]).name: None})
+    render.build_final_render(clips, str(tmp_path / "encode.mp4"), bgm_path=str(bgm), bgm_volume=0.3)
+
+    copy_cmd, encode_cmd = (call["cmd"] for call in ffmpeg_calls)
+    assert "1:a:0" in copy_cmd
+    assert "3:a:0" in encode_cmd
+    for cmd in (copy_cmd, encode_cmd):
+        assert cmd[cmd.index("-filter:a") + 1] == "volume=0.3"
+        assert "-shortest" in cmd
+
+
+def test_missing_clip_is_rejected(clips, ffmpeg_calls, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        render.build_final_render([*clips, str(tmp_path / "missing.mp4")], str(tmp_path / "final.mp4"))
+    assert ffmpeg_calls == []
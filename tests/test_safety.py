@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.canvas import outpaint, safety
+from app.canvas.detector import NullAnimalDetector
+from app.canvas.pipeline import build_canvas_image
+from app.config import settings
+
+SAMPLES = Path(__file__).resolve().parents[1] / "src"
+SAMPLE_NAMES = sorted(p.name for p in SAMPLES.iterdir() if p.suffix in {".jpg", ".jpeg"})
+
+# Verdicts of the original float32 gray / Euclidean gradient implementation at 1600x900,
+# keyed by (background style, fast mode). ("blur", False) flips image-17.jpeg under an
+# L1 gradient with an 8-bit gray plane.
+_ACCEPTED = {
+    ("cover", False): {"AdobeStock_327070164-768x532.jpeg", "image-17.jpeg"},
+    ("cover", True): {"AdobeStock_327070164-768x532.jpeg", "image-17.jpeg"},
+    ("blur", False): {"AdobeStock_327070164-768x532.jpeg", "image-17.jpeg"},
+    ("blur", True): {"AdobeStock_327070164-768x532.jpeg"},
+}
+
+
+class _EdgeCopyAdapter:
+    """Mirror outpaint under another type, so the region checks are not skipped."""
+
+    def __init__(self) -> None:
+        self._mirror = outpaint.MirrorOutpaintAdapter()
+
+    def outpaint(self, base_image_bgr, generation_mask, **kwargs):
+        return self._mirror.outpaint(base_image_bgr, generation_mask, **kwargs)
+
+
+def _load_bgr(name: str) -> np.ndarray:
+    with Image.open(SAMPLES / name) as img:
+        return np.ascontiguousarray(np.asarray(img.convert("RGB"))[:, :, ::-1])
+
+
+def _reference_grad(image_bgr: np.ndarray) -> np.ndarray:
+    gray = (
+        image_bgr[:, :, 0].astype(np.float32) * 0.114
+        + image_bgr[:, :, 1].astype(np.float32) * 0.587
+        + image_bgr[:, :, 2].astype(np.float32) * 0.299
+    )
+    gx = np.zeros_like(gray)
+    gy = np.zeros_like(gray)
+    gx[:, 1:-1] = gray[:, 2:] - gray[:, :-2]
+    gy[1:-1, :] = gray[2:, :] - gray[:-2, :]
+    return np.hypot(gx, gy)
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def kernel_path(request, monkeypatch):
+    kernels = safety._kernels()
+    if request.param == "numba":
+        if not kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(
+            safety,
+            "_kernels",
+            lambda: SimpleNamespace(NUMBA_AVAILABLE=False, count_true=kernels.count_true),
+        )
+    return request.param
+
+
+@pytest.fixture
+def canvas_settings(monkeypatch):
+    for name, value in {
+        "target_width": 1600,
+        "target_height": 900,
+        "strict_safety_checks": False,
+        "outpaint_max_attempts": 2,
+        "outpaint_min_width_for_generation": 640,
+        "canvas_edge_blend_px": 24,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+@pytest.mark.parametrize("name", SAMPLE_NAMES)
+def test_gradient_matches_reference(name, kernel_path):
+    image = _load_bgr(name)
+    grad = safety._grad_magnitude(safety._gray(image))
+    np.testing.assert_array_equal(grad, _reference_grad(image))
+
+
+@pytest.mark.parametrize("name", SAMPLE_NAMES)
+@pytest.mark.parametrize(("style", "fast_mode"), sorted(_ACCEPTED))
+def test_naturalness_verdicts_on_samples(
+    name, style, fast_mode, kernel_path, canvas_settings, monkeypatch
+):
+    monkeypatch.setattr(settings, "canvas_background_style", style)
+    result = build_canvas_image(
+        str(SAMPLES / name),
+        outpaint_adapter=_EdgeCopyAdapter(),
+        animal_detector=NullAnimalDetector(),
+        fast_mode=fast_mode,
+    )
+    assert result.safety_passed is (name in _ACCEPTED[style, fast_mode]), result.fallback_reason
+    if not result.safety_passed:
+        assert result.fallback_reason.startswith("generated region unnatural")
+
+
+def test_protected_region_change_is_rejected():
+    base = np.zeros((40, 60, 3), dtype=np.uint8)
+    candidate = base.copy()
+    mask = np.zeros((40, 60), dtype=np.uint8)
+    mask[:, 20:40] = 255
+    assert safety.check_protected_region_unchanged(base, candidate, mask).passed
+
+    candidate[:, 25:30] = 200
+    result = safety.check_protected_region_unchanged(base, candidate, mask)
+    assert not result.passed
+    assert result.reason.startswith("protected region changed too much")